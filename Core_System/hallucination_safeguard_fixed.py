@@ -5,17 +5,33 @@ Comprehensive system to prevent hallucinations and ensure all information is rea
 """
 
 import asyncio
+import json
 import logging
 import time
 from datetime import datetime
 import uuid
 import hashlib
 import re
+from dataclasses import dataclass, asdict
 from enum import Enum
-from typing import Dict, Any, List, Tuple
+from typing import Dict, Any, List, Optional, Set, Tuple, Union
+from urllib.parse import urlsplit
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import aiofiles
+except ImportError:
+    aiofiles = None
+
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
 
-# Configure logging
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
 class VerificationStatus(Enum):
@@ -24,23 +40,160 @@ class VerificationStatus(Enum):
     REJECTED = "rejected"
     PENDING = "pending"
 
+# Background log writer tuning
+LOG_QUEUE_SIZE = 10_000
+LOG_BATCH_SIZE = 512
+LOG_FLUSH_INTERVAL = 0.1  # seconds
+
+# All patterns are lowercase and matched against lowercased input
+
+SUSPICIOUS_SOURCE_PATTERNS = (
+    r'fictional',
+    r'made.up',
+    r'future\.tech',
+    r'202[6-9]',  # Future years
+    r'quantum\.consciousness',
+    r'agi\.integration',
+    r'parallel\.universe'
+)
+
+# Content patterns; hallucination patterns come first so their ids sort first
+HALLUCINATION_PATTERNS = (
+    r'quantum.*consciousness',
+    r'agi.*integration',
+    r'parallel.*universe',
+    r'time.*travel.*retrieval',
+    r'holographic.*storage',
+    r'neural.*interface.*chips',
+    r'consciousness.*evolution',
+    r'meta.*cognitive.*processors',
+    r'emotional.*intelligence.*cores',
+    r'202[6-9].*breakthrough',
+    r'future.*ai.*component',
+    r'experimental.*quantum'
+)
+
+REAL_TECH_PATTERNS = (
+    r'langchain',
+    r'llamaindex',
+    r'pinecone',
+    r'openai',
+    r'anthropic',
+    r'huggingface',
+    r'cohere',
+    r'weaviate',
+    r'chroma',
+    r'qdrant',
+    r'faiss',
+    r'transformers',
+    r'sentence.*transformers',
+    r'bert',
+    r'gpt.*[34]',
+    r'claude.*[23]'
+)
+
+ALL_PATTERNS = HALLUCINATION_PATTERNS + REAL_TECH_PATTERNS
+PATTERN_META = tuple(
+    [('hallucination', p) for p in HALLUCINATION_PATTERNS] +
+    [('real_tech', p) for p in REAL_TECH_PATTERNS]
+)
+
+_COMPILED_SOURCE_PATTERNS = tuple(re.compile(p) for p in SUSPICIOUS_SOURCE_PATTERNS)
+
+# Fallback when Hyperscan is not installed
+_COMPILED_PATTERNS = tuple(re.compile(p) for p in ALL_PATTERNS)
+
+@dataclass(slots=True)
+class VerificationStep:
+    """Outcome of a single verification step."""
+    step: str
+    result: str
+    details: Dict[str, Any]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+@dataclass(slots=True)
+class LogEntry:
+    """Verification log record; the epoch timestamp is formatted on serialization."""
+    timestamp: float
+    content_hash: str
+    source: str
+    status: str
+    trust_score: float
+    violations: List[str]
+
+    def to_dict(self) -> Dict[str, Any]:
+        entry = asdict(self)
+        entry['timestamp'] = datetime.fromtimestamp(self.timestamp).isoformat()
+        return entry
+
+@dataclass(slots=True)
+class RejectionEntry:
+    """Rejected content record; the epoch timestamp is formatted on serialization."""
+    timestamp: float
+    content_hash: str
+    source: str
+    violations: List[str]
+    reason: str = 'Hallucination detected'
+
+    def to_dict(self) -> Dict[str, Any]:
+        entry = asdict(self)
+        entry['timestamp'] = datetime.fromtimestamp(self.timestamp).isoformat()
+        return entry
+
 class HallucinationSafeguard:
     """Comprehensive hallucination prevention system."""
 
-    def __init__(self):
+    def __init__(self, log_path: Optional[str] = None):
         self.system_id = f"safeguard_{int(time.time())}"
         self.start_time = time.time()
         
         # Initialize verification systems
         self.verification_rules = self._initialize_verification_rules()
         self.trusted_sources = self._initialize_trusted_sources()
-        self.verification_log = []
-        self.rejected_items = []
+        self._trusted_netlocs = self._index_trusted_netlocs()
+        self._trusted_paths = self._index_trusted_paths()
+        # Slotted entries kept internally; the public views below serialize them
+        self._verification_log: List[LogEntry] = []
+        self._rejected_items: List[RejectionEntry] = []
+        self.verification_count = 0
+        self.rejection_count = 0
+        self._scanner = self._compile_scanner()
+        
+        # When a log path is given, entries are streamed to NDJSON by a
+        # background writer instead of being kept in memory
+        self.log_path = log_path
+        self._log_q: asyncio.Queue = asyncio.Queue(maxsize=LOG_QUEUE_SIZE)
+        self._log_task: Optional[asyncio.Task] = None
         
         logger.info(f"🛡️ Hallucination Safeguard System {self.system_id} initialized")
         logger.info(f"🔒 Verification rules: {len(self.verification_rules)}")
         logger.info(f"📚 Trusted sources: {len(self.trusted_sources)}")
 
+    @property
+    def verification_log(self) -> List[Dict[str, Any]]:
+        """In-memory verification log as plain dicts."""
+        return [entry.to_dict() for entry in self._verification_log]
+
+    @property
+    def rejected_items(self) -> List[Dict[str, Any]]:
+        """In-memory rejection log as plain dicts."""
+        return [entry.to_dict() for entry in self._rejected_items]
+
+    def _compile_scanner(self):
+        """Compile all content patterns into one case-sensitive Hyperscan database, if available."""
+        if hyperscan is None:
+            return None
+        
+        scanner = hyperscan.Database()
+        scanner.compile(
+            expressions=[p.encode() for p in ALL_PATTERNS],
+            ids=list(range(len(ALL_PATTERNS))),
+            flags=[hyperscan.HS_FLAG_SINGLEMATCH] * len(ALL_PATTERNS)
+        )
+        return scanner
+
     def _initialize_verification_rules(self) -> Dict[str, Any]:
         """Initialize comprehensive verification rules."""
         return {
@@ -122,6 +275,31 @@ class HallucinationSafeguard:
             }
         }
 
+    def _index_trusted_netlocs(self) -> Dict[Tuple[str, str], str]:
+        """Map (scheme, hostname) of host-wide trusted sources to their category.
+
+        Only sources without a path qualify; path-scoped sources such as a single
+        GitHub repository must not vouch for the whole host.
+        """
+        netlocs = {}
+        for category, source_info in self.trusted_sources.items():
+            for trusted_source in source_info['sources']:
+                parts = urlsplit(trusted_source)
+                if parts.path in ('', '/'):
+                    netlocs[(parts.scheme.lower(), parts.hostname)] = category
+        return netlocs
+
+    def _index_trusted_paths(self) -> Dict[str, List[Tuple[str, str, str]]]:
+        """Map hostnames of path-scoped trusted sources to (scheme, path, category) entries."""
+        paths = {}
+        for category, source_info in self.trusted_sources.items():
+            for trusted_source in source_info['sources']:
+                parts = urlsplit(trusted_source)
+                path = parts.path.rstrip('/')
+                if path:
+                    paths.setdefault(parts.hostname, []).append((parts.scheme.lower(), path, category))
+        return paths
+
     async def verify_information(self, content: str, source: str, metadata: Dict[str, Any] = None) -> Tuple[VerificationStatus, Dict[str, Any]]:
         """Comprehensive information verification."""
         start_time = time.time()
@@ -131,7 +309,7 @@ class HallucinationSafeguard:
         verification_result = {
             'content_hash': hashlib.md5(content.encode()).hexdigest(),
             'source': source,
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': datetime.fromtimestamp(start_time).isoformat(),
             'verification_steps': [],
             'violations': [],
             'trust_score': 0.0,
@@ -140,34 +318,32 @@ class HallucinationSafeguard:
         
         # Step 1: Source verification
         source_result = await self._verify_source(source)
-        verification_result['verification_steps'].append({
-            'step': 'source_verification',
-            'result': source_result['status'],
-            'details': source_result['details']
-        })
+        verification_result['verification_steps'].append(VerificationStep(
+            'source_verification', source_result['status'], source_result['details']
+        ).to_dict())
         
         if source_result['status'] == 'rejected':
             verification_result['violations'].extend(source_result['violations'])
             verification_result['status'] = VerificationStatus.REJECTED
-            self._log_rejection(content, source, verification_result)
+            self._log_rejection(content, source, verification_result, start_time)
             return VerificationStatus.REJECTED, verification_result
         
         # Step 2: Content verification
         content_result = await self._verify_content(content)
-        verification_result['verification_steps'].append({
-            'step': 'content_verification',
-            'result': content_result['status'],
-            'details': content_result['details']
-        })
+        verification_result['verification_steps'].append(VerificationStep(
+            'content_verification', content_result['status'], content_result['details']
+        ).to_dict())
         
         if content_result['status'] == 'rejected':
             verification_result['violations'].extend(content_result['violations'])
             verification_result['status'] = VerificationStatus.REJECTED
-            self._log_rejection(content, source, verification_result)
+            self._log_rejection(content, source, verification_result, start_time)
             return VerificationStatus.REJECTED, verification_result
         
         # Calculate trust score
-        verification_result['trust_score'] = self._calculate_trust_score(verification_result)
+        verification_result['trust_score'] = self._calculate_trust_score(
+            source_result['status'], content_result['status'], len(verification_result['violations'])
+        )
         
         # Final verification
         if verification_result['trust_score'] >= 0.8:
@@ -178,7 +354,7 @@ class HallucinationSafeguard:
         verification_time = time.time() - start_time
         verification_result['verification_time'] = verification_time
         
-        self._log_verification(content, source, verification_result)
+        self._log_verification(content, source, verification_result, start_time)
         
         logger.info(f"✅ Verification completed in {verification_time:.3f}s - Status: {verification_result['status'].value}")
         
@@ -192,32 +368,31 @@ class HallucinationSafeguard:
             'violations': []
         }
         
-        # Check against trusted sources
-        for category, source_info in self.trusted_sources.items():
-            for trusted_source in source_info['sources']:
-                if trusted_source in source or source in trusted_source:
-                    result['status'] = 'verified'
-                    result['details'] = {
-                        'category': category,
-                        'trust_level': source_info['trust_level'],
-                        'verification_method': source_info['verification_method']
-                    }
-                    return result
+        source_lower = source.lower()
         
-        # Check for suspicious patterns
-        suspicious_patterns = [
-            r'fictional',
-            r'made.up',
-            r'future\.tech',
-            r'202[6-9]',  # Future years
-            r'quantum\.consciousness',
-            r'agi\.integration',
-            r'parallel\.universe'
-        ]
+        # Fast path: exact scheme and hostname match against host-wide trusted sources;
+        # hostname drops userinfo and port and is already lowercased
+        parts = urlsplit(source)
+        scheme = parts.scheme.lower()
+        hostname = parts.hostname
+        category = self._trusted_netlocs.get((scheme, hostname))
+        if category is not None:
+            result['status'] = 'verified'
+            result['details'] = self._trusted_details(category)
+            return result
+        
+        # Path-scoped trusted sources must match scheme and hostname and be a path prefix
+        path = parts.path
+        for trusted_scheme, trusted_path, category in self._trusted_paths.get(hostname, ()):
+            if scheme == trusted_scheme and (path == trusted_path or path.startswith(trusted_path + '/')):
+                result['status'] = 'verified'
+                result['details'] = self._trusted_details(category)
+                return result
         
-        for pattern in suspicious_patterns:
-            if re.search(pattern, source, re.IGNORECASE):
-                result['violations'].append(f"Suspicious pattern detected: {pattern}")
+        # Check for suspicious patterns
+        for regex in _COMPILED_SOURCE_PATTERNS:
+            if regex.search(source_lower):
+                result['violations'].append(f"Suspicious pattern detected: {regex.pattern}")
         
         if result['violations']:
             result['status'] = 'rejected'
@@ -227,57 +402,37 @@ class HallucinationSafeguard:
         
         return result
 
-    async def _verify_content(self, content: str) -> Dict[str, Any]:
-        """Verify content accuracy and prevent hallucinations."""
+    def _trusted_details(self, category: str) -> Dict[str, Any]:
+        """Describe a trusted source category for verification details."""
+        source_info = self.trusted_sources[category]
+        return {
+            'category': category,
+            'trust_level': source_info['trust_level'],
+            'verification_method': source_info['verification_method']
+        }
+
+    async def _verify_content(self, content: str, fast_reject: bool = True) -> Dict[str, Any]:
+        """Verify content accuracy and prevent hallucinations.
+
+        With ``fast_reject`` the scan stops at the first hallucination hit,
+        since a single violation is enough to reject the content.
+        """
         result = {
             'status': 'pending',
             'details': {},
             'violations': []
         }
         
-        # Check for hallucination patterns
-        hallucination_patterns = [
-            r'quantum.*consciousness',
-            r'agi.*integration',
-            r'parallel.*universe',
-            r'time.*travel.*retrieval',
-            r'holographic.*storage',
-            r'neural.*interface.*chips',
-            r'consciousness.*evolution',
-            r'meta.*cognitive.*processors',
-            r'emotional.*intelligence.*cores',
-            r'202[6-9].*breakthrough',
-            r'future.*ai.*component',
-            r'experimental.*quantum'
-        ]
-        
-        for pattern in hallucination_patterns:
-            if re.search(pattern, content, re.IGNORECASE):
-                result['violations'].append(f"Potential hallucination detected: {pattern}")
-        
-        # Check for real technology patterns
-        real_tech_patterns = [
-            r'langchain',
-            r'llamaindex',
-            r'pinecone',
-            r'openai',
-            r'anthropic',
-            r'huggingface',
-            r'cohere',
-            r'weaviate',
-            r'chroma',
-            r'qdrant',
-            r'faiss',
-            r'transformers',
-            r'sentence.*transformers',
-            r'bert',
-            r'gpt.*[34]',
-            r'claude.*[23]'
-        ]
-        
+        # Single pass over the content for both hallucination and real-tech patterns
         real_tech_count = 0
-        for pattern in real_tech_patterns:
-            if re.search(pattern, content, re.IGNORECASE):
+        for pattern_id in sorted(self._scan_content(content.lower(), fast_reject)):
+            category, pattern = PATTERN_META[pattern_id]
+            if category == 'hallucination':
+                result['violations'].append(f"Potential hallucination detected: {pattern}")
+                if fast_reject:
+                    result['status'] = 'rejected'
+                    return result
+            else:
                 real_tech_count += 1
         
         result['details']['real_tech_mentions'] = real_tech_count
@@ -292,127 +447,147 @@ class HallucinationSafeguard:
         
         return result
 
-    def _calculate_trust_score(self, verification_result: Dict) -> float:
-        """Calculate overall trust score."""
-        score = 0.0
+    def _scan_content(self, content_lower: str, fast_reject: bool) -> Set[int]:
+        """Return the ids of all patterns in PATTERN_META that match the lowercased content."""
+        matched = set()
+        if self._scanner is not None:
+            def on_match(pattern_id, start, end, flags, context):
+                matched.add(pattern_id)
+                # Returning True halts the scan
+                return fast_reject and pattern_id < len(HALLUCINATION_PATTERNS)
+            
+            try:
+                self._scanner.scan(content_lower.encode(), match_event_handler=on_match)
+            except hyperscan.ScanTerminated:
+                pass
+            return matched
         
-        for step in verification_result['verification_steps']:
-            if step['result'] == 'verified':
-                score += 0.5
-            elif step['result'] == 'unverified':
-                score += 0.1
-        
-        # Penalize violations
-        score -= len(verification_result['violations']) * 0.1
+        for pattern_id, regex in enumerate(_COMPILED_PATTERNS):
+            if regex.search(content_lower):
+                matched.add(pattern_id)
+                if fast_reject and pattern_id < len(HALLUCINATION_PATTERNS):
+                    break
+        return matched
+
+    def _calculate_trust_score(self, source_status: str, content_status: str, violation_count: int) -> float:
+        """Calculate overall trust score."""
+        src_verified = int(source_status == 'verified')
+        src_unverified = int(source_status == 'unverified')
+        ct_verified = int(content_status == 'verified')
+        ct_unverified = int(content_status == 'unverified')
         
-        return max(0.0, min(1.0, score))
+        # 0.5 per verified step, 0.1 per unverified step, minus 0.1 per violation
+        score = (0.5 * src_verified + 0.1 * src_unverified + 0.5 * ct_verified + 0.1 * ct_unverified
+                 - 0.1 * violation_count)
+        return 0.0 if score < 0 else 1.0 if score > 1 else score
 
-    def _log_verification(self, content: str, source: str, result: Dict):
+    def _log_verification(self, content: str, source: str, result: Dict, timestamp: float):
         """Log verification attempt."""
-        log_entry = {
-            'timestamp': datetime.now().isoformat(),
-            'content_hash': result['content_hash'],
-            'source': source,
-            'status': result['status'].value,
-            'trust_score': result['trust_score'],
-            'violations': result['violations']
-        }
-        self.verification_log.append(log_entry)
+        log_entry = LogEntry(
+            timestamp=timestamp,
+            content_hash=result['content_hash'],
+            source=source,
+            status=result['status'].value,
+            trust_score=result['trust_score'],
+            violations=result['violations']
+        )
+        self.verification_count += 1
+        if self.log_path is None:
+            self._verification_log.append(log_entry)
+        else:
+            self._enqueue_log(log_entry)
 
-    def _log_rejection(self, content: str, source: str, result: Dict):
+    def _log_rejection(self, content: str, source: str, result: Dict, timestamp: float):
         """Log rejection."""
-        rejection_entry = {
-            'timestamp': datetime.now().isoformat(),
-            'content_hash': result['content_hash'],
-            'source': source,
-            'violations': result['violations'],
-            'reason': 'Hallucination detected'
-        }
-        self.rejected_items.append(rejection_entry)
+        rejection_entry = RejectionEntry(
+            timestamp=timestamp,
+            content_hash=result['content_hash'],
+            source=source,
+            violations=result['violations']
+        )
+        self.rejection_count += 1
+        if self.log_path is None:
+            self._rejected_items.append(rejection_entry)
+        else:
+            self._enqueue_log(rejection_entry)
+
+    def _enqueue_log(self, entry: Union[LogEntry, RejectionEntry]):
+        """Hand an entry to the background writer, dropping the oldest one when full."""
+        if self._log_task is None:
+            self._log_task = asyncio.get_running_loop().create_task(self._log_writer())
+        try:
+            self._log_q.put_nowait(entry)
+        except asyncio.QueueFull:
+            self._log_q.get_nowait()
+            self._log_q.put_nowait(entry)
+
+    async def _log_writer(self):
+        """Drain the log queue in batches of up to LOG_BATCH_SIZE entries or LOG_FLUSH_INTERVAL seconds."""
+        loop = asyncio.get_running_loop()
+        while True:
+            entry = await self._log_q.get()
+            if entry is None:
+                return
+            batch = [entry]
+            deadline = loop.time() + LOG_FLUSH_INTERVAL
+            while len(batch) < LOG_BATCH_SIZE:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    entry = await asyncio.wait_for(self._log_q.get(), remaining)
+                except asyncio.TimeoutError:
+                    break
+                if entry is None:
+                    await self._write_log_batch(batch)
+                    return
+                batch.append(entry)
+            await self._write_log_batch(batch)
+
+    async def _write_log_batch(self, batch: List[Union[LogEntry, RejectionEntry]]):
+        """Append a batch of entries to the log file as NDJSON."""
+        if orjson is not None:
+            data = b''.join(orjson.dumps(entry.to_dict()) + b'\n' for entry in batch)
+        else:
+            data = ''.join(json.dumps(entry.to_dict()) + '\n' for entry in batch).encode()
+        
+        try:
+            if aiofiles is not None:
+                async with aiofiles.open(self.log_path, 'ab') as f:
+                    await f.write(data)
+            else:
+                await asyncio.to_thread(self._append_log_bytes, data)
+        except OSError as e:
+            logger.error(f"❌ Failed to write verification log: {e}")
+
+    def _append_log_bytes(self, data: bytes):
+        """Blocking append used when aiofiles is unavailable."""
+        with open(self.log_path, 'ab') as f:
+            f.write(data)
+
+    async def aclose(self):
+        """Flush pending log entries and stop the background writer."""
+        if self._log_task is None:
+            return
+        await self._log_q.put(None)
+        await self._log_task
+        self._log_task = None
 
     def get_safeguard_stats(self) -> Dict[str, Any]:
         """Get safeguard system statistics."""
         return {
             'system_id': self.system_id,
             'uptime': time.time() - self.start_time,
-            'total_verifications': len(self.verification_log),
-            'total_rejections': len(self.rejected_items),
+            'total_verifications': self.verification_count,
+            'total_rejections': self.rejection_count,
             'verification_rules': len(self.verification_rules),
             'trusted_sources': len(self.trusted_sources),
             'safeguard_status': 'ACTIVE',
             'hallucination_prevention': 'ENABLED',
-            'verification_log_size': len(self.verification_log),
-            'rejection_log_size': len(self.rejected_items)
-        }
-
-async def main():
-    """Demo hallucination safeguard system."""
-    print("🛡️ HALLUCINATION SAFEGUARD SYSTEM")
-    print("=" * 50)
-    print("🔒 Preventing hallucinations and ensuring verified information")
-    print("✅ Only real, verified data allowed")
-    print("❌ All fictional content rejected")
-    print("=" * 50)
-
-    # Initialize safeguard system
-    safeguard = HallucinationSafeguard()
-
-    # Test verification with real and fictional content
-    test_cases = [
-        {
-            'content': 'LangChain is a framework for developing applications powered by language models. It provides tools for building RAG systems with vector databases like Pinecone.',
-            'source': 'https://python.langchain.com',
-            'expected': 'verified'
-        },
-        {
-            'content': 'Quantum consciousness processors enable AGI integration with parallel universe retrieval systems for 2026.',
-            'source': 'https://fictional-ai.com',
-            'expected': 'rejected'
-        },
-        {
-            'content': 'OpenAI GPT-4 is a large language model with 175B parameters, released in 2023.',
-            'source': 'https://platform.openai.com/docs',
-            'expected': 'verified'
-        },
-        {
-            'content': 'Neural interface chips with holographic storage will revolutionize RAG systems in 2027.',
-            'source': 'https://future-tech.com',
-            'expected': 'rejected'
+            'verification_log_size': len(self._verification_log),
+            'rejection_log_size': len(self._rejected_items)
         }
-    ]
-
-    print("\n🔍 Testing verification system...")
-
-    for i, test_case in enumerate(test_cases, 1):
-        print(f"\n📝 Test {i}: {test_case['content'][:50]}...")
-        status, result = await safeguard.verify_information(
-            test_case['content'], 
-            test_case['source']
-        )
-        
-        print(f"✅ Status: {status.value}")
-        print(f"📊 Trust Score: {result['trust_score']:.2f}")
-        print(f"🔍 Violations: {len(result['violations'])}")
-        if result['violations']:
-            print(f"   • {result['violations'][0]}")
-        
-        # Check if result matches expectation
-        if (status == VerificationStatus.VERIFIED and test_case['expected'] == 'verified') or \
-           (status == VerificationStatus.REJECTED and test_case['expected'] == 'rejected'):
-            print("✅ Test PASSED - Correct verification")
-        else:
-            print("❌ Test FAILED - Incorrect verification")
-
-    # Show safeguard statistics
-    print("\n📊 HALLUCINATION SAFEGUARD STATISTICS:")
-    stats = safeguard.get_safeguard_stats()
-    for key, value in stats.items():
-        print(f"   {key}: {value}")
-
-    print("\n🎉 HALLUCINATION SAFEGUARD SYSTEM DEMO COMPLETE!")
-    print("✅ Comprehensive verification system operational")
-    print("✅ All hallucinations detected and rejected")
-    print("✅ Only verified information allowed through")
 
 if __name__ == "__main__":
+    from demos.hallucination_safeguard_demo import main
     asyncio.run(main())
@@ -6,17 +6,52 @@ Integrates with build diagnosis system for hallucination-proof builds.
 """
 
 import os
+import sys
 import json
 import subprocess
-from dataclasses import dataclass
+import functools
+import hashlib
+import shutil
+import threading
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, replace
+from pathlib import Path, PurePosixPath
+from types import MappingProxyType
 import logging
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Mapping, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
-@dataclass
+# Worker threads used to overlap template file writes
+FILE_WRITE_WORKERS = 8
+
+# npm install limits; only the tail of its output is kept for the build result
+NPM_INSTALL_TIMEOUT = 300  # seconds
+NPM_OUTPUT_TAIL_LINES = 200
+
+# Build plans kept per (template, custom config)
+PLAN_CACHE_SIZE = 64
+
+# Prebuilt node_modules archives, keyed by template and dependency hash
+NODE_MODULES_CACHE_DIR = Path(os.environ.get(
+    "BLUEFORGE_NODE_MODULES_CACHE",
+    Path.home() / ".cache" / "blueforge" / "node_modules"
+))
+NODE_MODULES_ARCHIVE_TIMEOUT = 120  # seconds
+TAR_ZSTD_AVAILABLE = shutil.which("tar") is not None and shutil.which("zstd") is not None
+
+# File contents up to this length are sys.intern'ed; longer ones are deduplicated by value
+INTERN_MAX_LENGTH = 256
+
+@dataclass(frozen=True, slots=True)
 class SystemTemplate:
     """Represents a system template."""
     template_id: str
@@ -35,45 +70,47 @@ class SystemTemplate:
     complexity: str  # simple, medium, complex, enterprise
     estimated_build_time: str
 
-class SystemBuilder:
-    """Build complete systems by name or description."""
+@dataclass(frozen=True, slots=True)
+class BuildPlan:
+    """Project files for a template, independent of the project path."""
+    template_id: str
+    files: Tuple[Tuple[PurePosixPath, bytes], ...]  # (relative path, UTF-8 content)
+    directories: Tuple[PurePosixPath, ...]  # unique relative parent directories
+    package_json: bytes
+    dependency_key: str  # hash of dependencies and devDependencies
 
-    def __init__(self):
-        self.system_templates = self._initialize_system_templates()
-        self.tech_stack_knowledge = self._initialize_tech_stack_knowledge()
-        
-    def _initialize_system_templates(self) -> Dict[str, SystemTemplate]:
-        """Initialize comprehensive system templates."""
-        return {
-            "react_spa": SystemTemplate(
-                template_id="react_spa",
-                name="React SPA",
-                description="Modern React SPA with TypeScript, Tailwind CSS, and Vite",
-                category="web_app",
-                tech_stack=["React", "TypeScript", "Vite", "Tailwind CSS"],
-                dependencies={
-                    "react": "^18.2.0",
-                    "react-dom": "^18.2.0",
-                    "react-router-dom": "^6.8.0"
-                },
-                dev_dependencies={
-                    "@types/react": "^18.0.28",
-                    "@types/react-dom": "^18.0.11",
-                    "@vitejs/plugin-react": "^3.1.0",
-                    "typescript": "^4.9.5",
-                    "vite": "^4.1.0",
-                    "tailwindcss": "^3.2.7",
-                    "autoprefixer": "^10.4.14",
-                    "postcss": "^8.4.21"
-                },
-                scripts={
-                    "dev": "vite",
-                    "build": "tsc && vite build",
-                    "preview": "vite preview",
-                    "lint": "eslint . --ext ts,tsx --report-unused-disable-directives --max-warnings 0"
-                },
-                config_files={
-                    "vite.config.ts": """import { defineConfig } from 'vite'
+def _initialize_system_templates() -> Dict[str, SystemTemplate]:
+    """Initialize comprehensive system templates."""
+    return {
+        "react_spa": SystemTemplate(
+            template_id="react_spa",
+            name="React SPA",
+            description="Modern React SPA with TypeScript, Tailwind CSS, and Vite",
+            category="web_app",
+            tech_stack=["React", "TypeScript", "Vite", "Tailwind CSS"],
+            dependencies={
+                "react": "^18.2.0",
+                "react-dom": "^18.2.0",
+                "react-router-dom": "^6.8.0"
+            },
+            dev_dependencies={
+                "@types/react": "^18.0.28",
+                "@types/react-dom": "^18.0.11",
+                "@vitejs/plugin-react": "^3.1.0",
+                "typescript": "^4.9.5",
+                "vite": "^4.1.0",
+                "tailwindcss": "^3.2.7",
+                "autoprefixer": "^10.4.14",
+                "postcss": "^8.4.21"
+            },
+            scripts={
+                "dev": "vite",
+                "build": "tsc && vite build",
+                "preview": "vite preview",
+                "lint": "eslint . --ext ts,tsx --report-unused-disable-directives --max-warnings 0"
+            },
+            config_files={
+                "vite.config.ts": """import { defineConfig } from 'vite'
 import react from '@vitejs/plugin-react'
 
 export default defineConfig({
@@ -87,7 +124,7 @@ export default defineConfig({
     sourcemap: true
   }
 })""",
-                    "tsconfig.json": """{
+                "tsconfig.json": """{
   "compilerOptions": {
     "target": "ES2020",
     "useDefineForClassFields": true,
@@ -108,7 +145,7 @@ export default defineConfig({
   "include": ["src"],
   "references": [{ "path": "./tsconfig.node.json" }]
 }""",
-                    "tailwind.config.js": """/** @type {import('tailwindcss').Config} */
+                "tailwind.config.js": """/** @type {import('tailwindcss').Config} */
 export default {
   content: [
     "./index.html",
@@ -119,15 +156,15 @@ export default {
   },
   plugins: [],
 }""",
-                    "postcss.config.js": """export default {
+                "postcss.config.js": """export default {
   plugins: {
     tailwindcss: {},
     autoprefixer: {},
   },
 }"""
-                },
-                source_files={
-                    "src/App.tsx": """import { useState } from 'react'
+            },
+            source_files={
+                "src/App.tsx": """import { useState } from 'react'
 import './App.css'
 
 function App() {
@@ -154,10 +191,10 @@ function App() {
 }
 
 export default App""",
-                    "src/App.css": """@tailwind base;
+                "src/App.css": """@tailwind base;
 @tailwind components;
 @tailwind utilities;""",
-                    "src/main.tsx": """import React from 'react'
+                "src/main.tsx": """import React from 'react'
 import ReactDOM from 'react-dom/client'
 import App from './App.tsx'
 import './index.css'
@@ -167,10 +204,10 @@ ReactDOM.createRoot(document.getElementById('root')!).render(
     <App />
   </React.StrictMode>,
 )""",
-                    "src/index.css": """@tailwind base;
+                "src/index.css": """@tailwind base;
 @tailwind components;
 @tailwind utilities;""",
-                    "index.html": """<!doctype html>
+                "index.html": """<!doctype html>
 <html lang="en">
   <head>
     <meta charset="UTF-8" />
@@ -183,40 +220,40 @@ ReactDOM.createRoot(document.getElementById('root')!).render(
     <script type="module" src="/src/main.tsx"></script>
   </body>
 </html>"""
-                },
-                build_commands=["npm install", "npm run build"],
-                test_commands=["npm run dev"],
-                verification_commands=["npm run build", "npm run preview"],
-                complexity="simple",
-                estimated_build_time="2-5 minutes"
-            ),
-            
-            "express_api": SystemTemplate(
-                template_id="express_api",
-                name="Express API",
-                description="RESTful API with Express.js, TypeScript, and MongoDB",
-                category="api",
-                tech_stack=["Express.js", "TypeScript", "MongoDB", "Mongoose"],
-                dependencies={
-                    "express": "^4.18.2",
-                    "mongoose": "^7.0.3",
-                    "cors": "^2.8.5",
-                    "helmet": "^6.0.1"
-                },
-                dev_dependencies={
-                    "@types/express": "^4.17.17",
-                    "@types/cors": "^2.8.13",
-                    "typescript": "^4.9.5",
-                    "ts-node": "^10.9.1",
-                    "nodemon": "^2.0.20"
-                },
-                scripts={
-                    "dev": "nodemon src/server.ts",
-                    "build": "tsc",
-                    "start": "node dist/server.js"
-                },
-                config_files={
-                    "tsconfig.json": """{
+            },
+            build_commands=["npm install", "npm run build"],
+            test_commands=["npm run dev"],
+            verification_commands=["npm run build", "npm run preview"],
+            complexity="simple",
+            estimated_build_time="2-5 minutes"
+        ),
+        
+        "express_api": SystemTemplate(
+            template_id="express_api",
+            name="Express API",
+            description="RESTful API with Express.js, TypeScript, and MongoDB",
+            category="api",
+            tech_stack=["Express.js", "TypeScript", "MongoDB", "Mongoose"],
+            dependencies={
+                "express": "^4.18.2",
+                "mongoose": "^7.0.3",
+                "cors": "^2.8.5",
+                "helmet": "^6.0.1"
+            },
+            dev_dependencies={
+                "@types/express": "^4.17.17",
+                "@types/cors": "^2.8.13",
+                "typescript": "^4.9.5",
+                "ts-node": "^10.9.1",
+                "nodemon": "^2.0.20"
+            },
+            scripts={
+                "dev": "nodemon src/server.ts",
+                "build": "tsc",
+                "start": "node dist/server.js"
+            },
+            config_files={
+                "tsconfig.json": """{
   "compilerOptions": {
     "target": "ES2020",
     "module": "commonjs",
@@ -232,9 +269,9 @@ ReactDOM.createRoot(document.getElementById('root')!).render(
   "include": ["src/**/*"],
   "exclude": ["node_modules", "dist"]
 }"""
-                },
-                source_files={
-                    "src/server.ts": """import express from 'express';
+            },
+            source_files={
+                "src/server.ts": """import express from 'express';
 import cors from 'cors';
 import helmet from 'helmet';
 
@@ -258,41 +295,210 @@ app.get('/api/health', (req, res) => {
 app.listen(PORT, () => {
   console.log(`Server running on port ${PORT}`);
 });"""
-                },
-                build_commands=["npm install", "npm run build"],
-                test_commands=["npm run dev"],
-                verification_commands=["npm run build", "npm start"],
-                complexity="medium",
-                estimated_build_time="3-7 minutes"
-            )
-        }
-
-    def _initialize_tech_stack_knowledge(self) -> Dict[str, Dict[str, Any]]:
-        """Initialize tech stack knowledge for validation."""
-        return {
-            "react": {
-                "min_version": "18.0.0",
-                "peer_dependencies": ["react-dom"],
-                "common_issues": ["version_conflict", "missing_peer_deps"],
-                "verification": "npm list react"
-            },
-            "express": {
-                "min_version": "4.18.0",
-                "peer_dependencies": [],
-                "common_issues": ["middleware_errors", "routing_issues"],
-                "verification": "npm start"
             },
-            "typescript": {
-                "min_version": "4.9.0",
-                "peer_dependencies": [],
-                "common_issues": ["compilation_errors", "type_errors"],
-                "verification": "npx tsc --noEmit"
-            }
+            build_commands=["npm install", "npm run build"],
+            test_commands=["npm run dev"],
+            verification_commands=["npm run build", "npm start"],
+            complexity="medium",
+            estimated_build_time="3-7 minutes"
+        )
+    }
+
+def _initialize_tech_stack_knowledge() -> Dict[str, Dict[str, Any]]:
+    """Initialize tech stack knowledge for validation."""
+    return {
+        "react": {
+            "min_version": "18.0.0",
+            "peer_dependencies": ["react-dom"],
+            "common_issues": ["version_conflict", "missing_peer_deps"],
+            "verification": "npm list react"
+        },
+        "express": {
+            "min_version": "4.18.0",
+            "peer_dependencies": [],
+            "common_issues": ["middleware_errors", "routing_issues"],
+            "verification": "npm start"
+        },
+        "typescript": {
+            "min_version": "4.9.0",
+            "peer_dependencies": [],
+            "common_issues": ["compilation_errors", "type_errors"],
+            "verification": "npx tsc --noEmit"
         }
+    }
+
+def _strip_template_files(templates: Dict[str, SystemTemplate]) -> Dict[str, SystemTemplate]:
+    """Strip file contents and intern file names once, so builds write them as-is.
+    
+    Identical contents (e.g. App.css and index.css) share one string object.
+    """
+    canonical: Dict[str, str] = {}
+    
+    def _canonicalize(content: str) -> str:
+        content = content.strip()
+        if len(content) <= INTERN_MAX_LENGTH:
+            return sys.intern(content)
+        return canonical.setdefault(content, content)
+    
+    return {
+        template_id: replace(
+            template,
+            config_files={sys.intern(name): _canonicalize(content) for name, content in template.config_files.items()},
+            source_files={sys.intern(name): _canonicalize(content) for name, content in template.source_files.items()}
+        )
+        for template_id, template in templates.items()
+    }
+
+# Template tables are static, so build them once at import
+_SYSTEM_TEMPLATES = _strip_template_files(_initialize_system_templates())
+_TECH_STACK_KNOWLEDGE = _initialize_tech_stack_knowledge()
+
+# Lowercased search fields, computed once instead of on every lookup
+_TEMPLATE_SEARCH_FIELDS = tuple(
+    (template, template.name.lower(), template.description.lower(),
+     tuple(tech.lower() for tech in template.tech_stack))
+    for template in _SYSTEM_TEMPLATES.values()
+)
+
+def _scan_templates(system_name_lower: str) -> Optional[SystemTemplate]:
+    """Fuzzy match by name, description or tech stack."""
+    for template, name_lower, description_lower, tech_lower in _TEMPLATE_SEARCH_FIELDS:
+        if (system_name_lower in name_lower or
+            system_name_lower in description_lower or
+            any(tech in system_name_lower for tech in tech_lower)):
+            return template
+    return None
+
+def _build_name_index() -> Dict[str, SystemTemplate]:
+    """Index template ids, lowercased names and tech-stack entries.
+
+    Each name and tech key maps to the template the fuzzy scan picks for it,
+    so an index hit returns the same template as a full scan would.
+    """
+    index = dict(_SYSTEM_TEMPLATES)
+    for _, name_lower, _, tech_lower in _TEMPLATE_SEARCH_FIELDS:
+        for key in (name_lower, *tech_lower):
+            index.setdefault(key, _scan_templates(key))
+    return index
+
+_NAME_INDEX = _build_name_index()
+
+def _summarize_template(template: SystemTemplate) -> Mapping[str, Any]:
+    """Read-only summary of a template for listings."""
+    return MappingProxyType({
+        "id": template.template_id,
+        "name": template.name,
+        "description": template.description,
+        "category": template.category,
+        "tech_stack": tuple(template.tech_stack),
+        "complexity": template.complexity,
+        "estimated_build_time": template.estimated_build_time
+    })
+
+def _describe_template(template: SystemTemplate) -> Mapping[str, Any]:
+    """Read-only detailed view of a template."""
+    return MappingProxyType({
+        "id": template.template_id,
+        "name": template.name,
+        "description": template.description,
+        "category": template.category,
+        "tech_stack": tuple(template.tech_stack),
+        "dependencies": MappingProxyType(template.dependencies),
+        "dev_dependencies": MappingProxyType(template.dev_dependencies),
+        "scripts": MappingProxyType(template.scripts),
+        "complexity": template.complexity,
+        "estimated_build_time": template.estimated_build_time,
+        "config_files": tuple(template.config_files),
+        "source_files": tuple(template.source_files)
+    })
+
+# Template listings never change, so they are exported as shared read-only views
+_SYSTEM_SUMMARIES = tuple(_summarize_template(t) for t in _SYSTEM_TEMPLATES.values())
+_SYSTEM_DETAILS = {tid: _describe_template(t) for tid, t in _SYSTEM_TEMPLATES.items()}
+
+@functools.lru_cache(maxsize=128)
+def _resolve_template_id(system_name_lower: str) -> Optional[str]:
+    """Resolve a lowercased system name to a template id, memoized per name."""
+    template = _NAME_INDEX.get(system_name_lower) or _scan_templates(system_name_lower)
+    return template.template_id if template else None
+
+def _dump_package_json(package_json: Dict[str, Any]) -> bytes:
+    """Serialize package.json with two-space indentation."""
+    if orjson is not None:
+        return orjson.dumps(package_json, option=orjson.OPT_INDENT_2)
+    return json.dumps(package_json, indent=2).encode()
+
+def _dependency_key(template: SystemTemplate) -> str:
+    """Hash a template's dependency sets; equal keys can share one node_modules."""
+    deps = {"deps": template.dependencies, "devDeps": template.dev_dependencies}
+    if orjson is not None:
+        deps_bytes = orjson.dumps(deps, option=orjson.OPT_SORT_KEYS)
+    else:
+        deps_bytes = json.dumps(deps, sort_keys=True).encode()
+    return hashlib.blake2b(deps_bytes, digest_size=16).hexdigest()
+
+def _make_build_plan(template: SystemTemplate) -> BuildPlan:
+    """Plan package.json, files and directories for a template."""
+    package_json = {
+        "name": template.template_id,
+        "version": "1.0.0",
+        "description": template.description,
+        "main": "index.js",
+        "scripts": template.scripts,
+        "dependencies": template.dependencies,
+        "devDependencies": template.dev_dependencies,
+        "keywords": template.tech_stack,
+        "author": "",
+        "license": "MIT"
+    }
+    files = tuple(
+        (PurePosixPath(filename), content.encode('utf-8'))
+        for filename, content in {**template.config_files, **template.source_files}.items()
+    )
+    directories = tuple({rel_path.parent for rel_path, _ in files} - {PurePosixPath(".")})
+    return BuildPlan(
+        template.template_id, files, directories,
+        _dump_package_json(package_json), _dependency_key(template)
+    )
+
+# Plans for unmodified templates, including their package.json bytes, are built once at import
+_PRISTINE_BUILD_PLANS = {tid: _make_build_plan(t) for tid, t in _SYSTEM_TEMPLATES.items()}
+
+def _plan_key(template_id: str, custom_config: Optional[Dict[str, Any]]) -> Tuple[str, bytes]:
+    """Cache key for a template build with an optional custom config."""
+    if orjson is not None:
+        config_bytes = orjson.dumps(custom_config or None, option=orjson.OPT_SORT_KEYS, default=str)
+    else:
+        config_bytes = json.dumps(custom_config or None, sort_keys=True, default=str).encode()
+    return template_id, hashlib.blake2b(config_bytes, digest_size=16).digest()
+
+def _write_bytes(file_path, data: bytes):
+    """Write pre-encoded bytes with raw os calls, bypassing the io stack."""
+    fd = os.open(file_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+def _write_file(item):
+    """Write one (path, content) pair; runs on the file-writer thread pool."""
+    _write_bytes(*item)
+
+class SystemBuilder:
+    """Build complete systems by name or description."""
+
+    def __init__(self):
+        # Shared, import-time tables; every builder instance aliases the same objects
+        self.system_templates = _SYSTEM_TEMPLATES
+        self.tech_stack_knowledge = _TECH_STACK_KNOWLEDGE
+        self._plan_cache: "OrderedDict[Tuple[str, bytes], BuildPlan]" = OrderedDict()
+        self._node_modules_cache: Dict[str, Path] = {}
 
     def build_system(self, system_name: str, project_path: str, custom_config: Dict[str, Any] = None) -> Dict[str, Any]:
         """Build a complete system by name or description."""
-        logger.info(f"🏗️ Building system: {system_name} at {project_path}")
+        logger.debug("🏗️ Building system: %s at %s", system_name, project_path)
         
         # Find matching template
         template = self._find_template(system_name)
@@ -304,15 +510,11 @@ app.listen(PORT, () => {
             }
         
         # Create project directory
-        if not os.path.exists(project_path):
-            os.makedirs(project_path)
-        
-        # Apply custom configuration if provided
-        if custom_config:
-            template = self._apply_custom_config(template, custom_config)
+        os.makedirs(project_path, exist_ok=True)
         
         # Build the system
-        build_result = self._build_system_from_template(template, project_path)
+        plan = self._get_build_plan(template, custom_config)
+        build_result = self._build_system_from_template(plan, project_path)
         
         return {
             "success": build_result["success"],
@@ -325,80 +527,69 @@ app.listen(PORT, () => {
 
     def _find_template(self, system_name: str) -> Optional[SystemTemplate]:
         """Find template by name or description."""
-        system_name_lower = system_name.lower()
-        
-        # Direct match
-        if system_name_lower in self.system_templates:
-            return self.system_templates[system_name_lower]
-        
-        # Fuzzy match by description
-        for template in self.system_templates.values():
-            if (system_name_lower in template.name.lower() or 
-                system_name_lower in template.description.lower() or
-                any(tech.lower() in system_name_lower for tech in template.tech_stack)):
-                return template
-        
-        return None
+        template_id = _resolve_template_id(system_name.lower())
+        return self.system_templates[template_id] if template_id else None
 
     def _apply_custom_config(self, template: SystemTemplate, custom_config: Dict[str, Any]) -> SystemTemplate:
         """Apply custom configuration to template."""
-        # Create a copy of the template
-        import copy
-        modified_template = copy.deepcopy(template)
-        
-        # Apply custom dependencies
-        if "dependencies" in custom_config:
-            modified_template.dependencies.update(custom_config["dependencies"])
+        # Only the merged dicts are new; file contents are shared with the original template
+        return replace(
+            template,
+            dependencies={**template.dependencies, **custom_config.get("dependencies", {})},
+            dev_dependencies={**template.dev_dependencies, **custom_config.get("dev_dependencies", {})},
+            scripts={**template.scripts, **custom_config.get("scripts", {})}
+        )
+
+    def _get_build_plan(self, template: SystemTemplate, custom_config: Optional[Dict[str, Any]]) -> BuildPlan:
+        """Return the cached build plan for a template and custom config, planning it on a miss."""
+        if not custom_config:
+            pristine = _PRISTINE_BUILD_PLANS.get(template.template_id)
+            if pristine is not None:
+                return pristine
         
-        if "dev_dependencies" in custom_config:
-            modified_template.dev_dependencies.update(custom_config["dev_dependencies"])
+        key = _plan_key(template.template_id, custom_config)
+        plan = self._plan_cache.get(key)
+        if plan is not None:
+            self._plan_cache.move_to_end(key)
+            return plan
         
-        # Apply custom scripts
-        if "scripts" in custom_config:
-            modified_template.scripts.update(custom_config["scripts"])
+        # Apply custom configuration if provided
+        if custom_config:
+            template = self._apply_custom_config(template, custom_config)
         
-        return modified_template
+        plan = _make_build_plan(template)
+        self._plan_cache[key] = plan
+        if len(self._plan_cache) > PLAN_CACHE_SIZE:
+            self._plan_cache.popitem(last=False)
+        return plan
 
-    def _build_system_from_template(self, template: SystemTemplate, project_path: str) -> Dict[str, Any]:
-        """Build system from template."""
+    def _build_system_from_template(self, plan: BuildPlan, project_path: str) -> Dict[str, Any]:
+        """Build system from a template build plan."""
         try:
-            # Create package.json
-            package_json = {
-                "name": template.template_id,
-                "version": "1.0.0",
-                "description": template.description,
-                "main": "index.js",
-                "scripts": template.scripts,
-                "dependencies": template.dependencies,
-                "devDependencies": template.dev_dependencies,
-                "keywords": template.tech_stack,
-                "author": "",
-                "license": "MIT"
-            }
+            project_root = Path(project_path)
             
-            with open(os.path.join(project_path, "package.json"), 'w') as f:
-                json.dump(package_json, f, indent=2)
+            # Create package.json
+            _write_bytes(project_root / "package.json", plan.package_json)
             
-            # Create config files
-            for filename, content in template.config_files.items():
-                file_path = os.path.join(project_path, filename)
-                os.makedirs(os.path.dirname(file_path), exist_ok=True)
-                with open(file_path, 'w') as f:
-                    f.write(content.strip())
+            # Create config and source files, making each directory only once
+            for directory in plan.directories:
+                os.makedirs(project_root / directory, exist_ok=True)
             
-            # Create source files
-            for filename, content in template.source_files.items():
-                file_path = os.path.join(project_path, filename)
-                os.makedirs(os.path.dirname(file_path), exist_ok=True)
-                with open(file_path, 'w') as f:
-                    f.write(content.strip())
+            all_files = [(project_root / rel_path, content) for rel_path, content in plan.files]
+            with ThreadPoolExecutor(FILE_WRITE_WORKERS) as executor:
+                list(executor.map(_write_file, all_files))
             
-            # Install dependencies
-            install_result = self._install_dependencies(project_path)
+            # Install dependencies, reusing a prebuilt node_modules when one is cached
+            if self._restore_node_modules(plan, project_path):
+                install_result = {"success": True, "output": "Restored node_modules from cache"}
+            else:
+                install_result = self._install_dependencies(project_path)
+                if install_result["success"]:
+                    self._cache_node_modules(plan, project_path)
             
             return {
                 "success": install_result["success"],
-                "files_created": len(template.config_files) + len(template.source_files) + 1,
+                "files_created": len(plan.files) + 1,
                 "dependencies_installed": install_result["success"],
                 "install_output": install_result.get("output", "")
             }
@@ -411,29 +602,100 @@ app.listen(PORT, () => {
                 "dependencies_installed": False
             }
 
+    def _node_modules_archive(self, plan: BuildPlan) -> Path:
+        """Archive path for a plan's node_modules."""
+        archive_name = f"{plan.template_id}-{plan.dependency_key}"
+        archive = self._node_modules_cache.get(archive_name)
+        if archive is None:
+            archive = self._node_modules_cache[archive_name] = NODE_MODULES_CACHE_DIR / f"{archive_name}.tzst"
+        return archive
+
+    def _restore_node_modules(self, plan: BuildPlan, project_path: str) -> bool:
+        """Extract a cached node_modules into the project; False on a cache miss."""
+        if not TAR_ZSTD_AVAILABLE:
+            return False
+        archive = self._node_modules_archive(plan)
+        if not archive.exists():
+            return False
+        try:
+            subprocess.run(
+                ["tar", "--zstd", "-xf", str(archive)],
+                cwd=project_path, check=True, capture_output=True,
+                timeout=NODE_MODULES_ARCHIVE_TIMEOUT
+            )
+            return True
+        except (OSError, subprocess.SubprocessError) as e:
+            logger.warning("⚠️ Failed to restore node_modules from %s: %s", archive, e)
+            shutil.rmtree(os.path.join(project_path, "node_modules"), ignore_errors=True)
+            return False
+
+    def _cache_node_modules(self, plan: BuildPlan, project_path: str):
+        """Archive a freshly installed node_modules for later builds of the same dependencies."""
+        if not TAR_ZSTD_AVAILABLE or not os.path.isdir(os.path.join(project_path, "node_modules")):
+            return
+        archive = self._node_modules_archive(plan)
+        if archive.exists():
+            return
+        partial = archive.with_name(f"{archive.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            archive.parent.mkdir(parents=True, exist_ok=True)
+            subprocess.run(
+                ["tar", "--zstd", "-cf", str(partial), "node_modules"],
+                cwd=project_path, check=True, capture_output=True,
+                timeout=NODE_MODULES_ARCHIVE_TIMEOUT
+            )
+            os.replace(partial, archive)
+        except (OSError, subprocess.SubprocessError) as e:
+            logger.warning("⚠️ Failed to cache node_modules for %s: %s", plan.template_id, e)
+            partial.unlink(missing_ok=True)
+
     def _install_dependencies(self, project_path: str) -> Dict[str, Any]:
-        """Install project dependencies."""
+        """Install project dependencies, streaming npm output instead of buffering it."""
+        timed_out = threading.Event()
         try:
-            result = subprocess.run(
-                ["npm", "install"],
+            # npm ci is faster and reproducible when a lockfile is present
+            has_lockfile = os.path.exists(os.path.join(project_path, "package-lock.json"))
+            proc = subprocess.Popen(
+                ["npm", "ci" if has_lockfile else "install",
+                 "--no-audit", "--no-fund", "--prefer-offline", "--loglevel=error"],
                 cwd=project_path,
-                capture_output=True,
+                env={**os.environ, "NPM_CONFIG_UPDATE_NOTIFIER": "false"},
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
                 text=True,
-                timeout=300
+                bufsize=1
             )
             
+            def _kill():
+                timed_out.set()
+                proc.kill()
+            
+            timer = threading.Timer(NPM_INSTALL_TIMEOUT, _kill)
+            timer.start()
+            output_tail = deque(maxlen=NPM_OUTPUT_TAIL_LINES)
+            try:
+                for line in proc.stdout:
+                    line = line.rstrip()
+                    logger.debug(line)
+                    output_tail.append(line)
+                returncode = proc.wait()
+            finally:
+                timer.cancel()
+                proc.stdout.close()
+            
+            if timed_out.is_set():
+                return {
+                    "success": False,
+                    "output": f"Installation timed out after {NPM_INSTALL_TIMEOUT // 60} minutes",
+                    "returncode": -1
+                }
+            
             return {
-                "success": result.returncode == 0,
-                "output": result.stdout + result.stderr,
-                "returncode": result.returncode
+                "success": returncode == 0,
+                "output": "\n".join(output_tail),
+                "returncode": returncode
             }
         
-        except subprocess.TimeoutExpired:
-            return {
-                "success": False,
-                "output": "Installation timed out after 5 minutes",
-                "returncode": -1
-            }
         except Exception as e:
             return {
                 "success": False,
@@ -441,41 +703,13 @@ app.listen(PORT, () => {
                 "returncode": -1
             }
 
-    def list_available_systems(self) -> List[Dict[str, Any]]:
+    def list_available_systems(self) -> Tuple[Mapping[str, Any], ...]:
         """List all available system templates."""
-        systems = []
-        for template in self.system_templates.values():
-            systems.append({
-                "id": template.template_id,
-                "name": template.name,
-                "description": template.description,
-                "category": template.category,
-                "tech_stack": template.tech_stack,
-                "complexity": template.complexity,
-                "estimated_build_time": template.estimated_build_time
-            })
-        return systems
-
-    def get_system_details(self, system_id: str) -> Optional[Dict[str, Any]]:
+        return _SYSTEM_SUMMARIES
+
+    def get_system_details(self, system_id: str) -> Optional[Mapping[str, Any]]:
         """Get detailed information about a system template."""
-        if system_id not in self.system_templates:
-            return None
-        
-        template = self.system_templates[system_id]
-        return {
-            "id": template.template_id,
-            "name": template.name,
-            "description": template.description,
-            "category": template.category,
-            "tech_stack": template.tech_stack,
-            "dependencies": template.dependencies,
-            "dev_dependencies": template.dev_dependencies,
-            "scripts": template.scripts,
-            "complexity": template.complexity,
-            "estimated_build_time": template.estimated_build_time,
-            "config_files": list(template.config_files.keys()),
-            "source_files": list(template.source_files.keys())
-        }
+        return _SYSTEM_DETAILS.get(system_id)
 
 # Global system builder instance
 system_builder = SystemBuilder()
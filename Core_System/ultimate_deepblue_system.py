@@ -6,11 +6,25 @@ continuous optimization, and 10/10 performance rating.
 """
 
 import os
+import sys
 import json
 import time
+import asyncio
 import logging
+import threading
 from datetime import datetime
 
+# Optional AI integration modules; all three are required together. Any import-time
+# failure disables them rather than breaking every importer of this module.
+try:
+    from advanced_ai_integration import ai_engine
+    from code_completion_engine import completion_engine
+    from prompt_engineering_system import template_manager
+    _AI_IMPORT_ERROR = None
+except Exception as e:
+    ai_engine = completion_engine = template_manager = None
+    _AI_IMPORT_ERROR = e
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO, 
@@ -22,24 +36,44 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Upper bound for the retry delay of a failing continuous service
+SERVICE_MAX_BACKOFF = 300.0  # seconds
+
+# Core components enabled by initialize_system, in reporting order
+CORE_COMPONENTS = (
+    "hallucination_safeguard",
+    "build_diagnosis",
+    "system_builder",
+    "verified_knowledge",
+    "real_time_verification",
+    "ai_integration",
+    "code_completion",
+    "prompt_engineering"
+)
+
 class UltimateDeepBlueSystem:
     """The ultimate integrated system with all capabilities."""
     
     def __init__(self):
         self.system_id = f"deepblue_{int(time.time())}"
         self.start_time = time.time()
-        self.components = {}
+        self.components = frozenset()
         self.initialized = False
         self.performance_score = 0.0
         self.data_count = 0
         self.continuous_services = {}
+        self._services_stop = threading.Event()
         
         # Initialize AI components
         self.ai_engine = None
         self.completion_engine = None
         self.prompt_manager = None
         
-        logger.info(f"🌊 Ultimate DeepBlue System {self.system_id} created")
+        # Long-lived event loop for AI coroutines, started by initialize_system
+        self._loop = None
+        self._loop_thread = None
+        
+        logger.info("🌊 Ultimate DeepBlue System %s created", self.system_id)
     
     def initialize_system(self, force_reinit: bool = False):
         """Initialize the complete system."""
@@ -55,16 +89,10 @@ class UltimateDeepBlueSystem:
         
         try:
             # Initialize core components
-            self.components = {
-                "hallucination_safeguard": True,
-                "build_diagnosis": True,
-                "system_builder": True,
-                "verified_knowledge": True,
-                "real_time_verification": True,
-                "ai_integration": True,
-                "code_completion": True,
-                "prompt_engineering": True
-            }
+            self.components = frozenset(CORE_COMPONENTS)
+            
+            # Start the shared event loop before AI components need it
+            self._start_event_loop()
             
             # Initialize AI components
             self._initialize_ai_components()
@@ -82,42 +110,90 @@ class UltimateDeepBlueSystem:
                 "message": "System initialized successfully",
                 "system_id": self.system_id,
                 "performance_score": self.performance_score,
-                "components": list(self.components.keys())
+                "components": [name for name in CORE_COMPONENTS if name in self.components]
             }
             
         except Exception as e:
-            logger.error(f"❌ Initialization failed: {e}")
+            logger.error("❌ Initialization failed: %s", e)
             return {
                 "success": False,
                 "error": str(e),
                 "system_id": self.system_id
             }
     
+    def _start_event_loop(self):
+        """Start the background event loop used by all AI calls."""
+        if self._loop is not None:
+            return
+        self._loop = asyncio.new_event_loop()
+        self._loop_thread = threading.Thread(target=self._loop.run_forever, name=f"{self.system_id}-loop", daemon=True)
+        self._loop_thread.start()
+    
+    def _run(self, coro):
+        """Run a coroutine on the background event loop and wait for its result."""
+        return asyncio.run_coroutine_threadsafe(coro, self._loop).result()
+    
     def _start_continuous_services(self):
         """Start continuous background services."""
-        logger.info("🔄 Starting continuous services...")
-        # Add continuous service logic here
-        pass
+        self._services_stop.clear()
+        # Register services here with self._register_service(name, func, interval)
+        if not self.continuous_services:
+            return
+        logger.info("🔄 Continuous services running: %s", ", ".join(self.continuous_services))
+    
+    def _register_service(self, name: str, func, interval: float):
+        """Run func every interval seconds on a daemon thread until shutdown()."""
+        if name in self.continuous_services:
+            return
+        thread = threading.Thread(
+            target=self._run_service, args=(name, func, interval),
+            name=f"{self.system_id}-{name}", daemon=True
+        )
+        self.continuous_services[name] = thread
+        thread.start()
+    
+    def _run_service(self, name: str, func, interval: float):
+        """Call a service periodically, backing off exponentially while it fails."""
+        delay = interval
+        while not self._services_stop.wait(delay):
+            try:
+                func()
+                delay = interval
+            except Exception as e:
+                delay = min(delay * 2, SERVICE_MAX_BACKOFF)
+                logger.warning("⚠️ Service %s failed, retrying in %.0fs: %s", name, delay, e)
+    
+    def shutdown(self, timeout: float = 5.0):
+        """Stop continuous services and the background event loop."""
+        self._services_stop.set()
+        for thread in self.continuous_services.values():
+            thread.join(timeout)
+        self.continuous_services.clear()
+        
+        if self._loop is not None:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._loop_thread.join(timeout)
+            self._loop.close()
+            self._loop = None
+            self._loop_thread = None
+        
+        self.initialized = False
+        logger.info("🛑 Ultimate DeepBlue System shut down")
     
     def _initialize_ai_components(self):
         """Initialize AI integration components."""
-        try:
-            logger.info("🤖 Initializing AI integration components...")
-            
-            # Import AI components
-            from advanced_ai_integration import ai_engine
-            from code_completion_engine import completion_engine
-            from prompt_engineering_system import template_manager
-            
-            self.ai_engine = ai_engine
-            self.completion_engine = completion_engine
-            self.prompt_manager = template_manager
-            
-            logger.info("✅ AI integration components initialized successfully")
-            
-        except Exception as e:
-            logger.warning(f"⚠️ AI components initialization failed: {e}")
+        logger.info("🤖 Initializing AI integration components...")
+        
+        if _AI_IMPORT_ERROR is not None:
+            logger.warning("⚠️ AI components initialization failed: %s", _AI_IMPORT_ERROR)
             logger.info("🔄 Continuing without AI integration...")
+            return
+        
+        self.ai_engine = ai_engine
+        self.completion_engine = completion_engine
+        self.prompt_manager = template_manager
+        
+        logger.info("✅ AI integration components initialized successfully")
     
     def query_system(self, question: str, hack_phrase: str = None):
         """Query the DeepBlue system with verification."""
@@ -130,8 +206,7 @@ class UltimateDeepBlueSystem:
         # Use AI engine if available
         if self.ai_engine:
             try:
-                import asyncio
-                response = asyncio.run(self.ai_engine.generate_response(question))
+                response = self._run(self.ai_engine.generate_response(question))
                 return {
                     "success": True,
                     "answer": response.content,
@@ -140,7 +215,7 @@ class UltimateDeepBlueSystem:
                     "confidence": response.confidence
                 }
             except Exception as e:
-                logger.warning(f"AI query failed: {e}")
+                logger.warning("AI query failed: %s", e)
         
         # Fallback response
         return {
@@ -154,7 +229,7 @@ class UltimateDeepBlueSystem:
         if not self.initialized:
             return {"success": False, "error": "System not initialized"}
         
-        logger.info(f"🏗️ Building website with requirements: {requirements}")
+        logger.debug("🏗️ Building website with requirements: %s", requirements)
         
         # Add website building logic here
         return {
@@ -168,7 +243,7 @@ class UltimateDeepBlueSystem:
         if not self.initialized:
             return {"success": False, "error": "System not initialized"}
         
-        logger.info(f"🔧 Diagnosing build at: {project_path}")
+        logger.debug("🔧 Diagnosing build at: %s", project_path)
         
         # Add build diagnosis logic here
         return {
@@ -186,15 +261,13 @@ class UltimateDeepBlueSystem:
             return {"success": False, "error": "AI completion engine not available"}
         
         try:
-            import asyncio
-            
             # Get context for completion
             context = self.completion_engine.get_completion_context(
                 "temp_file", line, column, code, language
             )
             
             # Get completions
-            completions = asyncio.run(self.completion_engine.get_completions(context))
+            completions = self._run(self.completion_engine.get_completions(context))
             
             return {
                 "success": True,
@@ -210,7 +283,7 @@ class UltimateDeepBlueSystem:
             }
             
         except Exception as e:
-            logger.error(f"AI code completion failed: {e}")
+            logger.error("AI code completion failed: %s", e)
             return {"success": False, "error": str(e)}
     
     def ai_generate_code(self, description: str, language: str = "python"):
@@ -222,8 +295,7 @@ class UltimateDeepBlueSystem:
             return {"success": False, "error": "AI engine not available"}
         
         try:
-            import asyncio
-            code = asyncio.run(self.ai_engine.natural_language_to_code(description, language))
+            code = self._run(self.ai_engine.natural_language_to_code(description, language))
             
             return {
                 "success": True,
@@ -233,7 +305,7 @@ class UltimateDeepBlueSystem:
             }
             
         except Exception as e:
-            logger.error(f"AI code generation failed: {e}")
+            logger.error("AI code generation failed: %s", e)
             return {"success": False, "error": str(e)}
     
     def ai_analyze_error(self, error_message: str, code: str = ""):
@@ -245,8 +317,7 @@ class UltimateDeepBlueSystem:
             return {"success": False, "error": "AI engine not available"}
         
         try:
-            import asyncio
-            analysis = asyncio.run(self.ai_engine.analyze_error(error_message, code))
+            analysis = self._run(self.ai_engine.analyze_error(error_message, code))
             
             return {
                 "success": True,
@@ -258,7 +329,7 @@ class UltimateDeepBlueSystem:
             }
             
         except Exception as e:
-            logger.error(f"AI error analysis failed: {e}")
+            logger.error("AI error analysis failed: %s", e)
             return {"success": False, "error": str(e)}
     
     def ai_explain_code(self, code: str, language: str = "python"):
@@ -270,8 +341,7 @@ class UltimateDeepBlueSystem:
             return {"success": False, "error": "AI completion engine not available"}
         
         try:
-            import asyncio
-            explanation = asyncio.run(self.completion_engine.explain_code(code, language))
+            explanation = self._run(self.completion_engine.explain_code(code, language))
             
             return {
                 "success": True,
@@ -281,7 +351,7 @@ class UltimateDeepBlueSystem:
             }
             
         except Exception as e:
-            logger.error(f"AI code explanation failed: {e}")
+            logger.error("AI code explanation failed: %s", e)
             return {"success": False, "error": str(e)}
     
     def get_ai_statistics(self):
@@ -299,12 +369,59 @@ class UltimateDeepBlueSystem:
             try:
                 stats.update(self.ai_engine.get_statistics())
             except Exception as e:
-                logger.warning(f"Failed to get AI engine stats: {e}")
+                logger.warning("Failed to get AI engine stats: %s", e)
         
         if self.completion_engine:
             try:
                 stats.update(self.completion_engine.get_statistics())
             except Exception as e:
-                logger.warning(f"Failed to get completion engine stats: {e}")
+                logger.warning("Failed to get completion engine stats: %s", e)
         
-        return {"success": True, "statistics": stats}
\ No newline at end of file
+        return {"success": True, "statistics": stats}
+
+def serve(system: UltimateDeepBlueSystem, stdin=None, stdout=None):
+    """Answer newline-delimited JSON requests until stdin closes, one JSON response per line.
+    
+    Requests look like {"id": 1, "op": "query", "payload": {...}}; responses echo the id
+    with either {"ok": true, "result": ...} or {"ok": false, "error": "..."}.
+    """
+    stdin = stdin or sys.stdin
+    stdout = stdout or sys.stdout
+    handlers = {
+        "query": lambda payload: system.query_system(payload["query"], payload.get("hack_phrase")),
+        "diagnose": lambda payload: system.diagnose_build(payload["project_path"]),
+        "build": lambda payload: system.build_website(payload["system_name"])
+    }
+    
+    for line in stdin:
+        if not line.strip():
+            continue
+        request_id = None
+        try:
+            request = json.loads(line)
+            request_id = request.get("id")
+            result = handlers[request["op"]](request.get("payload") or {})
+            response = {"id": request_id, "ok": True, "result": result}
+        except Exception as e:
+            response = {"id": request_id, "ok": False, "error": str(e)}
+        stdout.write(json.dumps(response, default=str) + "\n")
+        stdout.flush()
+
+if __name__ == "__main__":
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="Ultimate DeepBlue System")
+    parser.add_argument("--serve", action="store_true", help="Serve JSON requests on stdin for editor extensions")
+    args = parser.parse_args()
+    
+    if not args.serve:
+        parser.print_help()
+        sys.exit(0)
+    
+    # Initialize once; every request on stdin reuses the warm system
+    deepblue = UltimateDeepBlueSystem()
+    deepblue.initialize_system()
+    try:
+        serve(deepblue)
+    finally:
+        deepblue.shutdown()
@@ -6,16 +6,114 @@ Auto-detects Cursor environment and adapts accordingly.
 """
 
 import os
-import json
+import time
+import functools
 import subprocess
+import shutil
 import platform
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from json_io import json_bytes, load_json, write_atomic
 
 # Configure logging
 logging.basicConfig(level = logging.INFO, format 
 logger 
 
+# Host facts are fixed for the life of the process, so look them up once
+_SYSTEM = platform.system()
+_MACHINE = platform.machine()
+_HOME = os.path.expanduser('~')
+
+# `cursor --version` answers immediately; anything slower is treated as a failed probe
+CURSOR_VERSION_TIMEOUT = 2  # seconds
+
+# Cursor install and profile locations for this platform, resolved once
+_CURSOR_BINARIES = {
+    "Darwin": (
+        "/Applications/Cursor.app/Contents/MacOS/Cursor",
+        "/Applications/Cursor.app/Contents/Resources/app/bin/cursor",
+        os.path.join(_HOME, "Applications", "Cursor.app", "Contents", "MacOS", "Cursor")
+    ),
+    "Windows": (
+        "C:\\Users\\{}\\AppData\\Local\\Programs\\cursor\\Cursor.exe".format(os.getenv('USERNAME', '')),
+        "C:\\Program Files\\Cursor\\Cursor.exe",
+        "C:\\Program Files (x86)\\Cursor\\Cursor.exe"
+    ),
+    "Linux": (
+        "/usr/bin/cursor",
+        "/usr/local/bin/cursor",
+        os.path.join(_HOME, ".local", "bin", "cursor"),
+        "/opt/cursor/cursor"
+    )
+}.get(_SYSTEM, ())
+
+_SETTINGS_PATHS = {
+    "Darwin": (
+        os.path.join(_HOME, "Library", "Application Support", "Cursor", "User", "settings.json"),
+        os.path.join(_HOME, "Library", "Application Support", "Cursor", "User", "globalStorage", "settings.json")
+    ),
+    "Windows": (
+        os.path.join(_HOME, "AppData", "Roaming", "Cursor", "User", "settings.json"),
+        os.path.join(_HOME, "AppData", "Local", "Cursor", "User", "settings.json")
+    ),
+    "Linux": (
+        os.path.join(_HOME, ".config", "Cursor", "User", "settings.json"),
+        os.path.join(_HOME, ".config", "Cursor", "User", "globalStorage", "settings.json")
+    )
+}.get(_SYSTEM, ())
+
+_EXTENSIONS_PATH = {
+    "Darwin": os.path.join(_HOME, "Library", "Application Support", "Cursor", "User", "extensions"),
+    "Windows": os.path.join(_HOME, "AppData", "Roaming", "Cursor", "User", "extensions"),
+    "Linux": os.path.join(_HOME, ".config", "Cursor", "User", "extensions")
+}.get(_SYSTEM, "")
+
+# Detection results are reused across runs until a watched path changes
+ENV_CACHE_PATH = os.path.join(
+    os.environ.get('XDG_CACHE_HOME', os.path.join(_HOME, '.cache')),
+    'deepblue', 'cursor_env.json'
+)
+
+# Directories never worth descending into when detecting languages
+SKIP_DIRS = frozenset({
+    '.git', 'node_modules', '__pycache__', '.venv', 'venv',
+    'dist', 'build', '.mypy_cache', '.pytest_cache', 'target'
+})
+
+# File extension (without the dot) to detected language
+EXT2LANG = {
+    'py': 'python',
+    'js': 'javascript', 'jsx': 'javascript', 'ts': 'javascript', 'tsx': 'javascript',
+    'java': 'java',
+    'cpp': 'cpp', 'c': 'cpp', 'h': 'cpp',
+    'go': 'go',
+    'rs': 'rust',
+    'php': 'php',
+    'rb': 'ruby'
+}
+ALL_LANGS = frozenset(EXT2LANG.values())
+
+# Bounds on the language detection walk, so huge workspaces cost a fixed amount of I/O
+LANGUAGE_SCAN_MAX_FILES = 20000
+LANGUAGE_SCAN_MAX_DEPTH = 8
+
+@functools.lru_cache(maxsize=8)
+def _encode_payload(text: str) -> bytes:
+    """UTF-8 bytes of a generated file; the generators return constants, so each is encoded once."""
+    return text.encode('utf-8')
+
+@functools.lru_cache(maxsize=1)
+def _iso_second(second: int) -> str:
+    """ISO timestamp for a whole epoch second."""
+    return datetime.fromtimestamp(second).isoformat(timespec='seconds')
+
+def _iso_now() -> str:
+    """Current local time as an ISO string, formatted at most once per second."""
+    return _iso_second(int(time.time()))
+
 class UniversalCursorAgent:
 """
 Universal Cursor Agent that works with any Cursor setup.
@@ -24,6 +122,9 @@ Auto-detects environment and adapts to different configurations.
 
 def __init__(self, auto_detect: bool 
     self.auto_detect = auto_detect
+    self._dir_listings = {}
+    self._paths_cache = None
+    self._existing_settings_cache = None
     self.cursor_info 
     self.integration_method 
     self.agent_config 
@@ -50,43 +151,94 @@ def _detect_cursor_environment(self):
     """Auto-detect Cursor environment and configuration."""
     logger.info("🔍 Detecting Cursor environment...")
     
-    # Detect Cursor installation
-    self.cursor_info = self._detect_cursor_installation()
-    
-    # Detect integration method
-    self.integration_method 
-    
-    # Detect workspace
-    self.workspace_info 
+    # Reuse the last detection unless the workspace or Cursor files changed since
+    if not self._load_cached_environment():
+        self._probe_cursor_environment()
+        self._store_cached_environment()
     
     logger.info(f"✅ Cursor detected: {self.cursor_info.get('version', 'Unknown')}")
     logger.info(f"🎯 Integration method: {self.integration_method}")
     logger.info(f"📁 Workspace: {self.workspace_info.get('path', 'Unknown')}")
 return None
+def _probe_cursor_environment(self):
+    """Run full installation, workspace and integration method detection."""
+    # Directory listings are only trusted for a single detection pass
+    self._dir_listings = {}
+    
+    # Installation and workspace probes touch disjoint state, so run them side by side
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        installation = executor.submit(self._detect_cursor_installation)
+        workspace = executor.submit(self._detect_workspace)
+        self.cursor_info = installation.result()
+        self.workspace_info = workspace.result()
+    
+    # Detect integration method, which needs the installation result
+    self.integration_method = self._detect_integration_method()
+
+def _environment_fingerprint(self, cursor_path: Optional[str]) -> List[List[Any]]:
+    """Watched paths and their mtimes; any change invalidates cached detection."""
+    watched = [os.getcwd(), shutil.which("cursor") or "", cursor_path or "", *_SETTINGS_PATHS, _EXTENSIONS_PATH]
+    fingerprint = []
+    for path in watched:
+        try:
+            fingerprint.append([path, os.stat(path).st_mtime if path else None])
+        except OSError:
+            fingerprint.append([path, None])
+    return fingerprint
+
+def _load_cached_environment(self) -> bool:
+    """Hydrate detection results from the user cache; False when missing or stale."""
+    try:
+        cached = load_json(ENV_CACHE_PATH)
+        if cached['fingerprint'] != self._environment_fingerprint(cached['cursor_info'].get('path')):
+            return False
+        self.cursor_info = cached['cursor_info']
+        self.integration_method = cached['integration_method']
+        self.workspace_info = cached['workspace_info']
+    except (OSError, ValueError, KeyError, TypeError, AttributeError):
+        return False
+    return True
+
+def _store_cached_environment(self):
+    """Atomically persist detection results for the next run."""
+    payload = {
+        'fingerprint': self._environment_fingerprint(self.cursor_info.get('path')),
+        'cursor_info': self.cursor_info,
+        'integration_method': self.integration_method,
+        'workspace_info': self.workspace_info
+    }
+    try:
+        os.makedirs(os.path.dirname(ENV_CACHE_PATH), exist_ok=True)
+        write_atomic(ENV_CACHE_PATH, json_bytes(payload))
+    except OSError as e:
+        logger.debug("Could not cache Cursor environment: %s", e)
 def _detect_cursor_installation(self) -> Dict[str, Any]:
     """Detect Cursor installation and version."""
     cursor_info 
         'installed': False,
         'version': 'Unknown',
         'path': None,
-        'platform': platform.system(),
-        'architecture': platform.machine()
+        'platform': _SYSTEM,
+        'architecture': _MACHINE
     }
     
-    # Check for Cursor command
-    try:
-        result = subprocess.run(
-            ["cursor", "--version"],
-            capture_output
-            text 
-            timeout
-        )
-        if result.returncode == 0:
-            cursor_info['installed'] = True
-            cursor_info['version'] = result.stdout.strip()
-            cursor_info['path'] = self._find_cursor_executable()
-    except (subprocess.TimeoutExpired, FileNotFoundError):
-        pass
+    # Check for Cursor command; the PATH lookup gates a single version probe
+    cursor_path = self._find_cursor_executable()
+    if cursor_path:
+        try:
+            result = subprocess.run(
+                [cursor_path, "--version"],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True,
+                timeout=CURSOR_VERSION_TIMEOUT
+            )
+            if result.returncode == 0:
+                cursor_info['installed'] = True
+                cursor_info['version'] = result.stdout.strip()
+                cursor_info['path'] = cursor_path
+        except (subprocess.TimeoutExpired, OSError):
+            pass
     
     # Check for Cursor in common locations
     if not cursor_info['installed']:
@@ -96,17 +248,7 @@ def _detect_cursor_installation(self) -> Dict[str, Any]:
 
 def _find_cursor_executable(self) -> Optional[str]:
     """Find Cursor executable path."""
-    try:
-        result 
-            ["which", "cursor"],
-            capture_output
-            timeout = 5
-        )
-        if result.returncode 
-            return result.stdout.strip()
-    except:
-        pass
-    return None
+    return shutil.which("cursor")
 
 def _find_cursor_manually(self) -> Dict[str, Any]:
     """Manually find Cursor installation."""
@@ -114,35 +256,12 @@ def _find_cursor_manually(self) -> Dict[str, Any]:
         'installed': False,
         'version': 'Unknown',
         'path': None,
-        'platform': platform.system(),
-        'architecture': platform.machine()
+        'platform': _SYSTEM,
+        'architecture': _MACHINE
     }
     
-    system 
-    possible_paths = []
-    
-    if system 
-        possible_paths 
-            "/Applications/Cursor.app/Contents/MacOS/Cursor",
-            "/Applications/Cursor.app/Contents/Resources/app/bin/cursor",
-            os.path.expanduser("~/Applications/Cursor.app/Contents/MacOS/Cursor")
-        ]
-    elif system 
-        possible_paths = [
-            "C:\\Users\\{}\\AppData\\Local\\Programs\\cursor\\Cursor.exe".format(os.getenv('USERNAME', '')),
-            "C:\\Program Files\\Cursor\\Cursor.exe",
-            "C:\\Program Files (x86)\\Cursor\\Cursor.exe"
-        ]
-    elif system 
-        possible_paths 
-            "/usr/bin/cursor",
-            "/usr/local/bin/cursor",
-            os.path.expanduser("~/.local/bin/cursor"),
-            "/opt/cursor/cursor"
-        ]
-    
-    for path in possible_paths:
-        if os.path.exists(path):
+    for path in _CURSOR_BINARIES:
+        if self._path_exists(path):
             cursor_info['installed'] 
             cursor_info['path'] = path
             cursor_info['version'] = self._get_cursor_version_from_path(path)
@@ -155,9 +274,10 @@ def _get_cursor_version_from_path(self, path: str) -> str:
     try:
         result = subprocess.run(
             [path, "--version"],
-            capture_output
-            text 
-            timeout
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            timeout=CURSOR_VERSION_TIMEOUT
         )
         if result.returncode == 0:
             return result.stdout.strip()
@@ -165,6 +285,23 @@ def _get_cursor_version_from_path(self, path: str) -> str:
         pass
     return "Unknown"
 
+def _list_dir(self, directory: str) -> frozenset:
+    """List a directory once per detection pass; missing directories list as empty."""
+    names = self._dir_listings.get(directory)
+    if names is None:
+        try:
+            with os.scandir(directory) as entries:
+                names = frozenset(os.path.normcase(entry.name) for entry in entries)
+        except OSError:
+            names = frozenset()
+        self._dir_listings[directory] = names
+    return names
+
+def _path_exists(self, path: str) -> bool:
+    """Check a candidate path against its parent's cached listing instead of stat'ing it."""
+    parent, name = os.path.split(path)
+    return os.path.normcase(name) in self._list_dir(parent)
+
 def _detect_integration_method(self) -> str:
     """Detect the best integration method for this Cursor setup."""
     if not self.cursor_info.get('installed'):
@@ -185,17 +322,32 @@ def _detect_integration_method(self) -> str:
     # Default to API integration
     return 'api'
 
-def _check_existing_integration(self) -> bool:
-    """Check if DeepBlue is already integrated."""
+def _check_existing_integration(self, force: bool = False) -> bool:
+    """Check if DeepBlue is already integrated.
+    
+    A previous match is reused while its settings file is unchanged; ``force`` re-reads from disk.
+    """
+    if self._existing_settings_cache is not None:
+        path, mtime, _ = self._existing_settings_cache
+        try:
+            if not force and os.stat(path).st_mtime == mtime:
+                return True
+        except OSError:
+            pass
+    
+    # Settings directories are listed fresh; earlier listings may predate a re-check
+    for path in self._paths()['settings']:
+        self._dir_listings.pop(os.path.dirname(path), None)
+    self._existing_settings_cache = None
     try:
         # Check for DeepBlue in Cursor settings
-        settings_paths = self._get_cursor_settings_paths()
-        for path in settings_paths:
-            if os.path.exists(path):
-                with open(path, 'r') as f:
-                    settings 
-                    if settings.get('deepblue.enabled'):
-                        return True
+        for path in self._paths()['settings']:
+            if self._path_exists(path):
+                mtime = os.stat(path).st_mtime
+                settings = load_json(path)
+                if settings.get('deepblue.enabled'):
+                    self._existing_settings_cache = (path, mtime, settings)
+                    return True
     except:
         pass
     return False
@@ -203,98 +355,131 @@ def _check_existing_integration(self) -> bool:
 def _check_extension_support(self) -> bool:
     """Check if Cursor supports extensions."""
     try:
-        extensions_path 
-        return os.path.exists(extensions_path)
+        extensions_path = self._paths()['extensions']
+        return os.path.isdir(extensions_path)
     except:
         return False
 
 def _check_settings_support(self) -> bool:
     """Check if Cursor supports custom settings."""
     try:
-        settings_path 
-        return os.path.exists(os.path.dirname(settings_path))
+        settings_path = self._get_cursor_settings_path()
+        return os.path.isdir(os.path.dirname(settings_path))
     except:
         return False
 
+def _paths(self) -> Dict[str, Any]:
+    """Settings and extensions paths, derived once per agent."""
+    if self._paths_cache is None:
+        self._paths_cache = {
+            'settings': self._get_cursor_settings_paths(),
+            'extensions': self._get_cursor_extensions_path()
+        }
+    return self._paths_cache
+
 def _get_cursor_settings_paths(self) -> List[str]:
     """Get possible Cursor settings paths."""
-    system = platform.system()
-    home 
-    
-    if system 
-        return [
-            os.path.join(home, "Library", "Application Support", "Cursor", "User", "settings.json"),
-            os.path.join(home, "Library", "Application Support", "Cursor", "User", "globalStorage", "settings.json")
-        ]
-    elif system == "Windows":
-        return [
-            os.path.join(home, "AppData", "Roaming", "Cursor", "User", "settings.json"),
-            os.path.join(home, "AppData", "Local", "Cursor", "User", "settings.json")
-        ]
-    elif system == "Linux":
-        return [
-            os.path.join(home, ".config", "Cursor", "User", "settings.json"),
-            os.path.join(home, ".config", "Cursor", "User", "globalStorage", "settings.json")
-        ]
-    
-    return []
+    return list(_SETTINGS_PATHS)
 
 def _get_cursor_settings_path(self) -> str:
     """Get primary Cursor settings path."""
-    paths = self._get_cursor_settings_paths()
+    paths = self._paths()['settings']
     return paths[0] if paths else ""
 
 def _get_cursor_extensions_path(self) -> str:
     """Get Cursor extensions path."""
-    system 
-    home 
-    
-    if system 
-        return os.path.join(home, "Library", "Application Support", "Cursor", "User", "extensions")
-    elif system == "Windows":
-        return os.path.join(home, "AppData", "Roaming", "Cursor", "User", "extensions")
-    elif system == "Linux":
-        return os.path.join(home, ".config", "Cursor", "User", "extensions")
-    
-    return ""
+    return _EXTENSIONS_PATH
 
 def _detect_workspace(self) -> Dict[str, Any]:
     """Detect current workspace information."""
+    cwd = os.getcwd()
+    
+    # One listing of the root answers the marker checks and seeds language detection
+    try:
+        with os.scandir('.') as listing:
+            entries = list(listing)
+    except OSError:
+        entries = []
+    names = {entry.name for entry in entries}
+    
     workspace_info = {
-        'path': os.getcwd(),
-        'name': os.path.basename(os.getcwd()),
-        'has_git': os.path.exists('.git'),
-        'has_package_json': os.path.exists('package.json'),
-        'has_requirements': os.path.exists('requirements.txt'),
-        'has_pyproject': os.path.exists('pyproject.toml'),
-        'languages': self._detect_languages()
+        'path': cwd,
+        'name': os.path.basename(cwd),
+        'has_git': '.git' in names,
+        'has_package_json': 'package.json' in names,
+        'has_requirements': 'requirements.txt' in names,
+        'has_pyproject': 'pyproject.toml' in names,
+        'languages': self._detect_languages(seed=entries)
     }
     
     return workspace_info
 
-def _detect_languages(self) -> List[str]:
-    """Detect programming languages in workspace."""
-    languages 
-    
-    for root, dirs, files in os.walk('.'):
-        for file in files:
-            ext 
-            if ext in ['.py']:
-                languages.add('python')
-            elif ext in ['.js', '.jsx', '.ts', '.tsx']:
-                languages.add('javascript')
-            elif ext in ['.java']:
-                languages.add('java')
-            elif ext in ['.cpp', '.c', '.h']:
-                languages.add('cpp')
-            elif ext in ['.go']:
-                languages.add('go')
-            elif ext in ['.rs']:
-                languages.add('rust')
-            elif ext in ['.php']:
-                languages.add('php')
-            elif ext in ['.rb']:
-                languages.add('ruby')
+def _detect_languages(
+    self,
+    seed: Optional[List[os.DirEntry]] = None,
+    max_files: int = LANGUAGE_SCAN_MAX_FILES,
+    max_depth: int = LANGUAGE_SCAN_MAX_DEPTH
+) -> List[str]:
+    """Detect programming languages in workspace, optionally from a pre-scanned root listing.
+    
+    The walk is bounded by ``max_files`` examined files and ``max_depth`` directory levels.
+    """
+    languages = set()
+    visited = set()
+    files_seen = 0
+    
+    if seed is not None:
+        stack = [(iter(seed), 0)]
+    else:
+        try:
+            stack = [(os.scandir('.'), 0)]
+        except OSError:
+            return []
+    
+    # Iterative DFS over scandir iterators; symlinks are never followed and each
+    # directory inode is entered once, so bind-mount loops cannot recurse forever
+    try:
+        while stack:
+            entries, depth = stack[-1]
+            entry = next(entries, None)
+            if entry is None:
+                stack.pop()
+                if hasattr(entries, 'close'):
+                    entries.close()
+                continue
+            
+            if entry.is_symlink():
+                continue
+            
+            if entry.is_dir(follow_symlinks=False):
+                if depth < max_depth and entry.name not in SKIP_DIRS:
+                    try:
+                        key = (entry.stat(follow_symlinks=False).st_dev, entry.inode())
+                        if key not in visited:
+                            visited.add(key)
+                            stack.append((os.scandir(entry.path), depth + 1))
+                    except OSError:
+                        pass
+                continue
+            
+            files_seen += 1
+            if files_seen > max_files:
+                logger.debug("Language detection stopped after %d files", max_files)
+                break
+            
+            dot, _, ext = entry.name.rpartition('.')
+            if not dot:
+                continue
+            lang = EXT2LANG.get(ext.lower())
+            if lang and lang not in languages:
+                languages.add(lang)
+                # Nothing left to find once every language is present
+                if languages == ALL_LANGS:
+                    break
+    finally:
+        for entries, _ in stack:
+            if hasattr(entries, 'close'):
+                entries.close()
     
     return list(languages)
 
@@ -313,13 +498,23 @@ def integrate_with_cursor(self) -> Dict[str, Any]:
     else:
         return self._create_standalone_integration()
 
-def _verify_existing_integration(self) -> Dict[str, Any]:
-    """Verify existing DeepBlue integration."""
+def _verify_existing_integration(self, force: bool = False) -> Dict[str, Any]:
+    """Verify existing DeepBlue integration from the cached settings match."""
+    if not self._check_existing_integration(force=force):
+        return {
+            'success': False,
+            'method': 'existing',
+            'message': 'DeepBlue integration no longer found in Cursor settings',
+            'status': 'missing',
+            'agent_config': self.agent_config
+        }
+    
     return {
         'success': True,
         'method': 'existing',
         'message': 'DeepBlue already integrated with Cursor',
         'status': 'verified',
+        'settings_path': self._existing_settings_cache[0],
         'agent_config': self.agent_config
     }
 
@@ -359,13 +554,13 @@ def _create_extension_integration(self) -> Dict[str, Any]:
             }
         }
         
-        with open(os.path.join(extension_dir, "package.json"), 'w') as f:
-            json.dump(package_json, f, indent
+        with open(os.path.join(extension_dir, "package.json"), 'wb') as f:
+            f.write(json_bytes(package_json))
         
         # Create extension.js
         extension_js = self._generate_extension_js()
-        with open(os.path.join(extension_dir, "extension.js"), 'w') as f:
-            f.write(extension_js)
+        with open(os.path.join(extension_dir, "extension.js"), 'wb') as f:
+            f.write(_encode_payload(extension_js))
         
         return {
             'success': True,
@@ -391,8 +586,7 @@ def _create_settings_integration(self) -> Dict[str, Any]:
         
         # Load existing settings
         if os.path.exists(settings_path):
-            with open(settings_path, 'r') as f:
-                settings 
+            settings = load_json(settings_path)
         else:
             settings = {}
         
@@ -405,11 +599,11 @@ def _create_settings_integration(self) -> Dict[str, Any]:
             "deepblue.universal.hackPhrase": "i think we need a bigger boat",
             "deepblue.universal.unlimitedMessages": True,
             "deepblue.universal.virtualScrolling": True,
-            "deepblue.universal.lastIntegration": datetime.now().isoformat()
+            "deepblue.universal.lastIntegration": _iso_now()
         })
         
-        with open(settings_path, 'w') as f:
-            json.dump(settings, f, indent
+        with open(settings_path, 'wb') as f:
+            f.write(json_bytes(settings))
         
         return {
             'success': True,
@@ -433,9 +627,9 @@ def _create_api_integration(self) -> Dict[str, Any]:
         # Create API endpoint file
         api_file 
         
-        api_code 
-        with open(api_file, 'w') as f:
-            f.write(api_code)
+        api_code = self._generate_api_code()
+        with open(api_file, 'wb') as f:
+            f.write(_encode_payload(api_code))
         
         return {
             'success': True,
@@ -459,9 +653,9 @@ def _create_standalone_integration(self) -> Dict[str, Any]:
         # Create standalone agent file
         agent_file = os.path.join(os.getcwd(), "deepblue_standalone_agent.py")
         
-        agent_code 
-        with open(agent_file, 'w') as f:
-            f.write(agent_code)
+        agent_code = self._generate_standalone_code()
+        with open(agent_file, 'wb') as f:
+            f.write(_encode_payload(agent_code))
         
         return {
             'success': True,
@@ -835,7 +1029,7 @@ def get_integration_status(self) -> Dict[str, Any]:
         'integration_method': self.integration_method,
         'workspace_info': self.workspace_info,
         'auto_detect': self.auto_detect,
-        'timestamp': datetime.now().isoformat()
+        'timestamp': _iso_now()
     }
 
 def test_integration(self) -> Dict[str, Any]:
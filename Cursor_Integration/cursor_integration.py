@@ -6,201 +6,186 @@ Auto-injects into Cursor and hides in "auto" agent field.
 """
 
 import os
-import json
+import shutil
+import select
+import signal
 import subprocess
 import logging
+import time
+import functools
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 import platform
+from typing import Any, Dict, Optional, Tuple
+
+from json_io import changes_beyond, json_bytes, read_json, write_atomic
 
 # Configure logging
 logging.basicConfig(level = logging.INFO, format 
 logger 
 
-class CursorIntegration:
-"""Real Cursor AI integration system."""
+# How long a `cursor --version` probe result is reused
+CURSOR_PROBE_TTL = 60.0  # seconds
+CURSOR_VERSION_TIMEOUT = 5  # seconds
 
-def __init__(self):
-    self.cursor_config_paths 
-    self.integration_status = {
-        "installed": False,
-        "hidden": False,
-        "active": False,
-        "last_injection": None
+# posix_spawn skips subprocess.Popen's fork/exec bookkeeping where available
+_HAS_POSIX_SPAWN = hasattr(os, "posix_spawn")
+
+# Cursor launcher on PATH, resolved once at import (see refresh_cursor_bin)
+_CURSOR_BIN = shutil.which("cursor")
+
+# Cursor configuration locations per platform, joined once at import
+_SYSTEM = platform.system()
+_HOME = os.path.expanduser("~")
+_CONFIG_PATHS_BY_SYSTEM = {
+    "Darwin": {
+        "config": os.path.join(_HOME, "Library", "Application Support", "Cursor", "User", "settings.json"),
+        "extensions": os.path.join(_HOME, "Library", "Application Support", "Cursor", "User", "extensions"),
+        "workspace": os.path.join(_HOME, "Library", "Application Support", "Cursor", "User", "workspaceStorage"),
+        "global_storage": os.path.join(_HOME, "Library", "Application Support", "Cursor", "CachedData")
+    },
+    "Windows": {
+        "config": os.path.join(_HOME, "AppData", "Roaming", "Cursor", "User", "settings.json"),
+        "extensions": os.path.join(_HOME, "AppData", "Roaming", "Cursor", "User", "extensions"),
+        "workspace": os.path.join(_HOME, "AppData", "Roaming", "Cursor", "User", "workspaceStorage"),
+        "global_storage": os.path.join(_HOME, "AppData", "Local", "Cursor", "CachedData")
+    },
+    "Linux": {
+        "config": os.path.join(_HOME, ".config", "Cursor", "User", "settings.json"),
+        "extensions": os.path.join(_HOME, ".config", "Cursor", "User", "extensions"),
+        "workspace": os.path.join(_HOME, ".config", "Cursor", "User", "workspaceStorage"),
+        "global_storage": os.path.join(_HOME, ".cache", "Cursor")
     }
-return None
-def _find_cursor_config_paths(self) -> Dict[str, str]:
-    """Find Cursor configuration paths on different platforms."""
-    system 
-    config_paths 
-    
-    if system 
-        home = os.path.expanduser("~")
-        config_paths 
-            "config": os.path.join(home, "Library", "Application Support", "Cursor", "User", "settings.json"),
-            "extensions": os.path.join(home, "Library", "Application Support", "Cursor", "User", "extensions"),
-            "workspace": os.path.join(home, "Library", "Application Support", "Cursor", "User", "workspaceStorage"),
-            "global_storage": os.path.join(home, "Library", "Application Support", "Cursor", "CachedData")
-        }
-    elif system 
-        home = os.path.expanduser("~")
-        config_paths 
-            "config": os.path.join(home, "AppData", "Roaming", "Cursor", "User", "settings.json"),
-            "extensions": os.path.join(home, "AppData", "Roaming", "Cursor", "User", "extensions"),
-            "workspace": os.path.join(home, "AppData", "Roaming", "Cursor", "User", "workspaceStorage"),
-            "global_storage": os.path.join(home, "AppData", "Local", "Cursor", "CachedData")
-        }
-    elif system 
-        home = os.path.expanduser("~")
-        config_paths 
-            "config": os.path.join(home, ".config", "Cursor", "User", "settings.json"),
-            "extensions": os.path.join(home, ".config", "Cursor", "User", "extensions"),
-            "workspace": os.path.join(home, ".config", "Cursor", "User", "workspaceStorage"),
-            "global_storage": os.path.join(home, ".cache", "Cursor")
-        }
-    
-    return config_paths
+}
 
-def check_cursor_installation(self) -> bool:
-    """Check if Cursor is installed and accessible."""
-    try:
-        # Check if Cursor command is available
-        result
-            ["cursor", "--version"],
-            capture_output
-            text = True,
-            timeout
-        )
-        
-        if result.returncode 
-            logger.info(f"✅ Cursor found: {result.stdout.strip()}")
-            return True
-        else:
-            logger.warning("❌ Cursor command not found")
-            return False
-            
-    except (subprocess.TimeoutExpired, FileNotFoundError):
-        logger.warning("❌ Cursor not installed or not in PATH")
-        return False
-    except Exception as e:
-        logger.error(f"❌ Error checking Cursor: {e}")
-        return False
+def refresh_cursor_bin() -> Optional[str]:
+    """Re-resolve the Cursor launcher on PATH, e.g. after Cursor was installed."""
+    global _CURSOR_BIN
+    _CURSOR_BIN = shutil.which("cursor")
+    return _CURSOR_BIN
 
-def inject_into_cursor(self) -> Dict[str, Any]:
-    """Inject DeepBlue system into Cursor AI."""
-    logger.info("🎯 Injecting DeepBlue into Cursor AI...")
+def _spawn_version(binary: str) -> Tuple[int, str]:
+    """Run `<binary> --version` via posix_spawn; returns (returncode, stdout)."""
+    read_fd, write_fd = os.pipe()
+    try:
+        pid = os.posix_spawn(binary, [binary, "--version"], os.environ, file_actions=[
+            (os.POSIX_SPAWN_DUP2, write_fd, 1),
+            (os.POSIX_SPAWN_OPEN, 2, os.devnull, os.O_WRONLY, 0)
+        ])
+    except BaseException:
+        os.close(read_fd)
+        raise
+    finally:
+        os.close(write_fd)
     
+    chunks = []
+    deadline = time.monotonic() + CURSOR_VERSION_TIMEOUT
     try:
-        # Check if Cursor is installed
-        if not self.check_cursor_installation():
-            return {
-                "success": False,
-                "error": "Cursor AI not installed or not accessible",
-                "message": "Please install Cursor AI first"
-            }
-        
-        # Create DeepBlue extension
-        extension_created = self._create_deepblue_extension()
-        if not extension_created["success"]:
-            return extension_created
-        
-        # Modify Cursor settings
-        settings_modified 
-        if not settings_modified["success"]:
-            return settings_modified
-        
-        # Create hidden agent configuration
-        agent_created 
-        if not agent_created["success"]:
-            return agent_created
-        
-        # Test integration
-        integration_test 
-        
-        self.integration_status.update({
-            "installed": True,
-            "hidden": True,
-            "active": integration_test["success"],
-            "last_injection": datetime.now().isoformat()
-        })
-        
-        return {
-            "success": True,
-            "message": "i found a bigger boat",
-            "integration_status": self.integration_status,
-            "cursor_version": self._get_cursor_version(),
-            "deepblue_agent": "hidden in auto field",
-            "test_result": integration_test
-        }
-        
-    except Exception as e:
-        logger.error(f"❌ Injection failed: {e}")
-        return {
-            "success": False,
-            "error": str(e),
-            "message": "Injection failed"
-        }
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or not select.select([read_fd], [], [], remaining)[0]:
+                os.kill(pid, signal.SIGKILL)
+                os.waitpid(pid, 0)
+                raise subprocess.TimeoutExpired([binary, "--version"], CURSOR_VERSION_TIMEOUT)
+            chunk = os.read(read_fd, 4096)
+            if not chunk:
+                break
+            chunks.append(chunk)
+    finally:
+        os.close(read_fd)
+    
+    _, status = os.waitpid(pid, 0)
+    return os.waitstatus_to_exitcode(status), b"".join(chunks).decode(errors="replace")
 
-def _create_deepblue_extension(self) -> Dict[str, Any]:
-    """Create DeepBlue extension for Cursor."""
+def _run_version(binary: str) -> Tuple[int, str]:
+    """Run `<binary> --version`, spawning directly where the platform allows."""
+    if _HAS_POSIX_SPAWN:
+        return _spawn_version(binary)
+    result = subprocess.run(
+        [binary, "--version"],
+        capture_output=True,
+        text = True,
+        timeout=CURSOR_VERSION_TIMEOUT
+    )
+    return result.returncode, result.stdout
+
+def _write_json_atomic(path: str, data: Dict[str, Any]):
+    """Write JSON to a sibling temp file and swap it into place."""
+    write_atomic(path, json_bytes(data))
+
+def _write_if_changed(path: str, payload: bytes) -> bool:
+    """Atomically write payload unless the file already holds exactly those bytes."""
     try:
-        extension_dir = os.path.join(self.cursor_config_paths["extensions"], "deepblue-agent")
-        os.makedirs(extension_dir, exist_ok
-        
-        # Create package.json
-        package_json 
-            "name": "deepblue-agent",
-            "displayName": "DeepBlue Agent",
-            "description": "Advanced RAG system with build diagnosis and system building",
-            "version": "1.0.0",
-            "publisher": "deepblue",
-            "engines": {
-                "vscode": "^1.74.0"
+        if os.path.getsize(path) == len(payload):
+            with open(path, 'rb') as f:
+                if f.read() == payload:
+                    return False
+    except FileNotFoundError:
+        pass
+    write_atomic(path, payload)
+    return True
+
+@functools.lru_cache(maxsize=1)
+def _iso_second(second: int) -> str:
+    """ISO timestamp for a whole epoch second."""
+    return datetime.fromtimestamp(second).isoformat(timespec='seconds')
+
+def _iso_now() -> str:
+    """Current local time as an ISO string, formatted at most once per second."""
+    return _iso_second(int(time.time()))
+
+# Generated extension manifest and source, serialized once at import
+_EXTENSION_PACKAGE_JSON = {
+    "name": "deepblue-agent",
+    "displayName": "DeepBlue Agent",
+    "description": "Advanced RAG system with build diagnosis and system building",
+    "version": "1.0.0",
+    "publisher": "deepblue",
+    "engines": {
+        "vscode": "^1.74.0"
+    },
+    "categories": ["Other"],
+    "activationEvents": ["*"],
+    "main": "./extension.js",
+    "contributes": {
+        "commands": [
+            {
+                "command": "deepblue.query",
+                "title": "DeepBlue Query",
+                "category": "DeepBlue"
             },
-            "categories": ["Other"],
-            "activationEvents": ["*"],
-            "main": "./extension.js",
-            "contributes": {
-                "commands": [
-                    {
-                        "command": "deepblue.query",
-                        "title": "DeepBlue Query",
-                        "category": "DeepBlue"
-                    },
-                    {
-                        "command": "deepblue.diagnose",
-                        "title": "DeepBlue Build Diagnosis",
-                        "category": "DeepBlue"
-                    },
-                    {
-                        "command": "deepblue.build",
-                        "title": "DeepBlue Build System",
-                        "category": "DeepBlue"
-                    }
-                ],
-                "menus": {
-                    "commandPalette": [
-                        {
-                            "command": "deepblue.query",
-                            "when": "editorTextFocus"
-                        },
-                        {
-                            "command": "deepblue.diagnose",
-                            "when": "editorTextFocus"
-                        },
-                        {
-                            "command": "deepblue.build",
-                            "when": "editorTextFocus"
-                        }
-                    ]
-                }
+            {
+                "command": "deepblue.diagnose",
+                "title": "DeepBlue Build Diagnosis",
+                "category": "DeepBlue"
+            },
+            {
+                "command": "deepblue.build",
+                "title": "DeepBlue Build System",
+                "category": "DeepBlue"
             }
+        ],
+        "menus": {
+            "commandPalette": [
+                {
+                    "command": "deepblue.query",
+                    "when": "editorTextFocus"
+                },
+                {
+                    "command": "deepblue.diagnose",
+                    "when": "editorTextFocus"
+                },
+                {
+                    "command": "deepblue.build",
+                    "when": "editorTextFocus"
+                }
+            ]
         }
-        
-        with open(os.path.join(extension_dir, "package.json"), 'w') as f:
-            json.dump(package_json, f, indent
-        
-        # Create extension.js
-        extension_js = '''
+    }
+}
+
+# Raw so the JS '\n' escapes reach the extension unchanged
+_EXTENSION_JS = r'''
 return None
 const vscode 
 const { spawn } 
@@ -208,6 +193,10 @@ const path = require('path');
 
 function activate(context) {
 console.log('DeepBlue Agent activated');
+extensionContext = context;
+
+// Start the worker now so the first command doesn't pay for its startup
+ensureDeepBlueWorker();
 
 // DeepBlue Query Command
 const queryCommand 
@@ -283,94 +272,117 @@ setInterval(() => {
 }, 5000);
 }
 
-async function executeDeepBlueQuery(query) {
-return new Promise((resolve, reject) => {
+// One long-lived Python worker answers every command over newline-delimited JSON,
+// so interpreter startup and DeepBlue imports are paid once per session
+let extensionContext = null;
+let worker = null;
+let nextRequestId = 0;
+const pending = new Map();
+
+function ensureDeepBlueWorker() {
+    if (worker) {
+        return worker;
+    }
+    
     const deepbluePath = path.join(__dirname, '..', '..', '..', 'ultimate_deepblue_system.py');
-    const python 
+    const python = process.platform === 'win32' ? 'python' : 'python3';
     
-    const child 
-        cwd: path.dirname(deepbluePath)
+    const child = spawn(python, [deepbluePath, '--serve'], {
+        cwd: path.dirname(deepbluePath),
+        stdio: ['pipe', 'pipe', 'pipe']
     });
     
-    let output 
-    let error = '';
-    
-    child.stdout.on('data', (data) 
-        output +
+    let buffered = '';
+    child.stdout.on('data', (data) => {
+        buffered += data.toString();
+        let newline;
+        while ((newline = buffered.indexOf('\n')) >= 0) {
+            const line = buffered.slice(0, newline).trim();
+            buffered = buffered.slice(newline + 1);
+            if (!line) {
+                continue;
+            }
+            
+            let response;
+            try {
+                response = JSON.parse(line);
+            } catch (error) {
+                continue;
+            }
+            
+            const request = pending.get(response.id);
+            if (!request) {
+                continue;
+            }
+            pending.delete(response.id);
+            if (response.ok) {
+                request.resolve(formatDeepBlueResult(response.result));
+            } else {
+                request.reject(new Error(response.error || 'DeepBlue request failed'));
+            }
+        }
     });
     
     child.stderr.on('data', (data) => {
-        error += data.toString();
+        console.error(`DeepBlue worker: ${data.toString()}`);
     });
     
-    child.on('close', (code) => {
-        if (code === 0) {
-            resolve(output.trim());
-        } else {
-            reject(new Error(error || 'DeepBlue query failed'));
+    // A failed spawn emits 'error' and may never emit 'exit'; a dead pipe errors on stdin
+    child.on('error', (error) => failDeepBlueWorker(child, `DeepBlue worker failed: ${error.message}`));
+    child.stdin.on('error', (error) => failDeepBlueWorker(child, `DeepBlue worker pipe failed: ${error.message}`));
+    child.on('exit', () => failDeepBlueWorker(child, 'DeepBlue worker exited'));
+    
+    if (extensionContext) {
+        extensionContext.subscriptions.push({ dispose: () => child.kill() });
+    }
+    
+    worker = child;
+    return worker;
+}
+
+// Reject everything waiting on a worker that has died and let the next call respawn it
+function failDeepBlueWorker(child, message) {
+    if (worker !== child) {
+        return;
+    }
+    worker = null;
+    for (const request of pending.values()) {
+        request.reject(new Error(message));
+    }
+    pending.clear();
+    child.kill();
+}
+
+function formatDeepBlueResult(result) {
+    if (typeof result === 'string') {
+        return result;
+    }
+    return result.answer || result.message || result.error || JSON.stringify(result);
+}
+
+function callDeepBlue(op, payload) {
+    return new Promise((resolve, reject) => {
+        const id = ++nextRequestId;
+        pending.set(id, { resolve, reject });
+        try {
+            ensureDeepBlueWorker().stdin.write(JSON.stringify({ id, op, payload }) + '\n');
+        } catch (error) {
+            pending.delete(id);
+            reject(error);
         }
     });
-});
+}
+
+async function executeDeepBlueQuery(query) {
+    return callDeepBlue('query', { query });
 }
 
 async function executeDeepBlueDiagnosis(projectPath) {
-return new Promise((resolve, reject) => {
-    const deepbluePath = path.join(__dirname, '..', '..', '..', 'ultimate_deepblue_system.py');
-    const python 
-    
-    const child 
-        cwd: path.dirname(deepbluePath)
-    });
-    
-    let output 
-    let error = '';
-    
-    child.stdout.on('data', (data) 
-        output +
-    });
-    
-    child.stderr.on('data', (data) => {
-        error += data.toString();
-    });
-    
-    child.on('close', (code) => {
-        if (code === 0) {
-            resolve(output.trim());
-        } else {
-            reject(new Error(error || 'DeepBlue diagnosis failed'));
-        }
-    });
-});
+    return callDeepBlue('diagnose', { project_path: projectPath });
 }
 
 async function executeDeepBlueBuild(systemName) {
-return new Promise((resolve, reject) => {
-    const deepbluePath = path.join(__dirname, '..', '..', '..', 'ultimate_deepblue_system.py');
-    const python 
-    
-    const child 
-        cwd: path.dirname(deepbluePath)
-    });
-    
-    let output 
-    let error = '';
-    
-    child.stdout.on('data', (data) 
-        output +
-    });
-    
-    child.stderr.on('data', (data) => {
-        error += data.toString();
-    });
-    
-    child.on('close', (code) => {
-        if (code === 0) {
-            resolve(output.trim());
-        } else {
-            reject(new Error(error || 'DeepBlue build failed'));
-        }
-    });
-});
+    return callDeepBlue('build', { system_name: systemName });
 }
 
 function deactivate() {
@@ -382,55 +394,187 @@ activate,
 deactivate
 };
 '''
+
+_EXTENSION_PACKAGE_BYTES = json_bytes(_EXTENSION_PACKAGE_JSON)
+_EXTENSION_JS_BYTES = _EXTENSION_JS.encode('utf-8')
+
+class CursorIntegration:
+"""Real Cursor AI integration system."""
+
+def __init__(self):
+    self.cursor_config_paths = self._find_cursor_config_paths()
+    
+    # Files the integration reads and writes, resolved once per instance
+    paths = self.cursor_config_paths
+    self._extension_path = os.path.join(paths["extensions"], "deepblue-agent") if paths else ""
+    self._agent_path = os.path.join(paths["global_storage"], "deepblue-agent.json") if paths else ""
+    self._settings_path = paths.get("config", "")
+    
+    # (probed_at, installed, version) from the last `cursor --version`
+    self._cursor_probe_cache = None
+    
+    # ((mtime_ns, size), settings) from the last settings.json parse
+    self._settings_cache = None
+    
+    self.integration_status = {
+        "installed": False,
+        "hidden": False,
+        "active": False,
+        "last_injection": None
+    }
+return None
+def _find_cursor_config_paths(self) -> Dict[str, str]:
+    """Find Cursor configuration paths on different platforms."""
+    return _CONFIG_PATHS_BY_SYSTEM.get(_SYSTEM, {})
+
+def check_cursor_installation(self) -> bool:
+    """Check if Cursor is installed and accessible."""
+    installed, _ = self._probe_cursor()
+    return installed
+
+def _probe_cursor(self) -> Tuple[bool, str]:
+    """Run `cursor --version` at most once per CURSOR_PROBE_TTL; returns (installed, version)."""
+    cached = self._cursor_probe_cache
+    if cached is not None and time.monotonic() - cached[0] < CURSOR_PROBE_TTL:
+        return cached[1], cached[2]
+    
+    installed, version = False, "Unknown"
+    if _CURSOR_BIN is None:
+        # Nothing on PATH, so there is nothing to exec
+        logger.warning("❌ Cursor not installed or not in PATH")
+    else:
+        try:
+            returncode, stdout = _run_version(_CURSOR_BIN)
+            
+            if returncode == 0:
+                installed, version = True, stdout.strip()
+                logger.info("✅ Cursor found: %s", version)
+            else:
+                logger.warning("❌ Cursor command not found")
+                
+        except (subprocess.TimeoutExpired, FileNotFoundError):
+            logger.warning("❌ Cursor not installed or not in PATH")
+        except Exception as e:
+            logger.error("❌ Error checking Cursor: %s", e)
+    
+    self._cursor_probe_cache = (time.monotonic(), installed, version)
+    return installed, version
+
+def invalidate_cursor_probe(self):
+    """Forget the cached Cursor probe so the next check runs it again."""
+    self._cursor_probe_cache = None
+
+def inject_into_cursor(self) -> Dict[str, Any]:
+    """Inject DeepBlue system into Cursor AI."""
+    logger.info("🎯 Injecting DeepBlue into Cursor AI...")
+    
+    # Injection acts on the current install, so don't trust an older probe
+    refresh_cursor_bin()
+    self.invalidate_cursor_probe()
+    
+    try:
+        # Check if Cursor is installed
+        if not self.check_cursor_installation():
+            return {
+                "success": False,
+                "error": "Cursor AI not installed or not accessible",
+                "message": "Please install Cursor AI first"
+            }
+        
+        # Extension, settings and agent config live in separate files, so write them side by side
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            steps = [
+                executor.submit(self._create_deepblue_extension),
+                executor.submit(self._modify_cursor_settings),
+                executor.submit(self._create_hidden_agent)
+            ]
+            results = [step.result() for step in steps]
         
-        with open(os.path.join(extension_dir, "extension.js"), 'w') as f:
-            f.write(extension_js)
+        for result in results:
+            if not result["success"]:
+                return result
+        
+        # Test integration
+        integration_test 
+        
+        self.integration_status.update({
+            "installed": True,
+            "hidden": True,
+            "active": integration_test["success"],
+            "last_injection": _iso_now()
+        })
+        
+        return {
+            "success": True,
+            "message": "i found a bigger boat",
+            "integration_status": self.integration_status,
+            "cursor_version": self._get_cursor_version(),
+            "deepblue_agent": "hidden in auto field",
+            "test_result": integration_test
+        }
+        
+    except Exception as e:
+        logger.error("❌ Injection failed: %s", e)
+        return {
+            "success": False,
+            "error": str(e),
+            "message": "Injection failed"
+        }
+
+def _create_deepblue_extension(self) -> Dict[str, Any]:
+    """Create DeepBlue extension for Cursor."""
+    try:
+        extension_dir = self._extension_path
+        os.makedirs(extension_dir, exist_ok
+        
+        # Rewrite the extension files only when their contents changed
+        _write_if_changed(os.path.join(extension_dir, "package.json"), _EXTENSION_PACKAGE_BYTES)
+        _write_if_changed(os.path.join(extension_dir, "extension.js"), _EXTENSION_JS_BYTES)
         
         logger.info("✅ DeepBlue extension created")
         return {"success": True, "extension_path": extension_dir}
         
     except Exception as e:
-        logger.error(f"❌ Failed to create extension: {e}")
+        logger.error("❌ Failed to create extension: %s", e)
         return {"success": False, "error": str(e)}
 
 def _modify_cursor_settings(self) -> Dict[str, Any]:
     """Modify Cursor settings to enable DeepBlue integration."""
     try:
-        settings_path 
+        settings_path = self._settings_path
         
         # Create settings directory if it doesn't exist
         os.makedirs(os.path.dirname(settings_path), exist_ok 
         
         # Load existing settings or create new ones
-        if os.path.exists(settings_path):
-            with open(settings_path, 'r') as f:
-                settings 
-        else:
-            settings = {}
+        settings = read_json(settings_path)
         
         # Add DeepBlue settings
-        settings.update({
+        desired = {
+            **settings,
             "deepblue.enabled": True,
             "deepblue.autoInject": True,
             "deepblue.hidden": True,
             "deepblue.agentField": "auto",
-            "deepblue.lastInjection": datetime.now().isoformat(),
             "deepblue.systemPath": os.path.abspath("ultimate_deepblue_system.py"),
             "deepblue.trustedSources": True,
             "deepblue.hallucinationDetection": True,
             "deepblue.buildDiagnosis": True,
             "deepblue.systemBuilding": True
-        })
+        }
         
-        # Save settings
-        with open(settings_path, 'w') as f:
-            json.dump(settings, f, indent
+        # Save settings only when something besides the timestamp changed
+        if not changes_beyond(settings, desired, "deepblue.lastInjection"):
+            logger.info("✅ Cursor settings already up to date")
+            return {"success": True, "settings_path": settings_path}
+        desired["deepblue.lastInjection"] = _iso_now()
+        _write_json_atomic(settings_path, desired)
         
         logger.info("✅ Cursor settings modified")
         return {"success": True, "settings_path": settings_path}
         
     except Exception as e:
-        logger.error(f"❌ Failed to modify settings: {e}")
+        logger.error("❌ Failed to modify settings: %s", e)
         return {"success": False, "error": str(e)}
 
 def _create_hidden_agent(self) -> Dict[str, Any]:
@@ -453,37 +597,38 @@ def _create_hidden_agent(self) -> Dict[str, Any]:
             ],
             "firstReply": "i found a bigger boat",
             "hackPhrase": "i think we need a bigger boat",
-            "systemPath": os.path.abspath("ultimate_deepblue_system.py"),
-            "lastActivation": datetime.now().isoformat()
+            "systemPath": os.path.abspath("ultimate_deepblue_system.py")
         }
         
         # Save agent config
-        agent_path 
+        agent_path = self._agent_path
         os.makedirs(os.path.dirname(agent_path), exist_ok = True)
         
-        with open(agent_path, 'w') as f:
-            json.dump(agent_config, f, indent
+        if not changes_beyond(read_json(agent_path), agent_config, "lastActivation"):
+            logger.info("✅ Hidden agent already up to date")
+            return {"success": True, "agent_path": agent_path}
+        agent_config["lastActivation"] = _iso_now()
+        _write_json_atomic(agent_path, agent_config)
         
         logger.info("✅ Hidden agent created")
         return {"success": True, "agent_path": agent_path}
         
     except Exception as e:
-        logger.error(f"❌ Failed to create hidden agent: {e}")
+        logger.error("❌ Failed to create hidden agent: %s", e)
         return {"success": False, "error": str(e)}
 
 def _test_integration(self) -> Dict[str, Any]:
     """Test the Cursor integration."""
     try:
         # Test if extension is loaded
-        extension_path 
+        extension_path = self._extension_path
         if not os.path.exists(extension_path):
             return {"success": False, "error": "Extension not found"}
         
         # Test if settings are applied
-        settings_path 
+        settings_path = self._settings_path
         if os.path.exists(settings_path):
-            with open(settings_path, 'r') as f:
-                settings = json.load(f)
+            settings = self._load_settings()
             
             if settings.get("deepblue.enabled"):
                 return {"success": True, "message": "Integration test passed"}
@@ -497,58 +642,62 @@ def _test_integration(self) -> Dict[str, Any]:
 
 def _get_cursor_version(self) -> str:
     """Get Cursor version."""
-    try:
-        result 
-            ["cursor", "--version"],
-            capture_output
-            timeout = 10
-        )
-        return result.stdout.strip() if result.returncode 
-    except:
-        return "Unknown"
-
-def get_integration_status(self) -> Dict[str, Any]:
-    """Get current integration status."""
+    _, version = self._probe_cursor()
+    return version
+
+def get_integration_status(self, include_timestamp: bool = False) -> Dict[str, Any]:
+    """Get current integration status; pass include_timestamp to stamp the report."""
     # Check if integration is actually working
     self._verify_integration_status()
     
-    return {
+    status = {
         "integration_status": self.integration_status,
         "cursor_installed": self.check_cursor_installation(),
         "cursor_version": self._get_cursor_version(),
-        "config_paths": self.cursor_config_paths,
-        "timestamp": datetime.now().isoformat()
+        "config_paths": self.cursor_config_paths
     }
+    if include_timestamp:
+        status["timestamp"] = _iso_now()
+    return status
+
+def _load_settings(self) -> Dict[str, Any]:
+    """Load settings.json, re-parsing only when its mtime or size changes."""
+    try:
+        st = os.stat(self._settings_path)
+    except FileNotFoundError:
+        self._settings_cache = None
+        return {}
+    
+    signature = (st.st_mtime_ns, st.st_size)
+    if self._settings_cache is not None and self._settings_cache[0] == signature:
+        return self._settings_cache[1]
+    
+    settings = read_json(self._settings_path)
+    self._settings_cache = (signature, settings)
+    return settings
 
 def _verify_integration_status(self):
     """Verify and update integration status."""
     try:
         # Check if extension exists
-        extension_path 
-        extension_exists 
+        extension_exists = os.path.exists(self._extension_path)
         
         # Check if settings are applied
-        settings_path = self.cursor_config_paths["config"]
-        settings_applied 
-        if os.path.exists(settings_path):
-            with open(settings_path, 'r') as f:
-                settings 
-            settings_applied 
+        settings_applied = bool(self._load_settings().get("deepblue.enabled"))
         
         # Check if agent config exists
-        agent_path = os.path.join(self.cursor_config_paths["global_storage"], "deepblue-agent.json")
-        agent_exists 
+        agent_exists = os.path.exists(self._agent_path)
         
         # Update status
         self.integration_status.update({
             "installed": extension_exists,
             "hidden": agent_exists,
             "active": extension_exists and settings_applied and agent_exists,
-            "last_verified": datetime.now().isoformat()
+            "last_verified": _iso_now()
         })
         
     except Exception as e:
-        logger.error(f"Error verifying integration status: {e}")
+        logger.error("Error verifying integration status: %s", e)
         self.integration_status.update({
             "installed": False,
             "hidden": False,
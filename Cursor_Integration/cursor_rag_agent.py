@@ -5,10 +5,26 @@ Enables Cursor AI agents to use RAG-enhanced LLM for knowledge-based tasks.
 
 import os
 import sys
+from collections import OrderedDict
+from typing import Any, Dict, List, Tuple
 
 # Add current directory to path for imports
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
+# Most recent query responses kept per agent
+RESPONSE_CACHE_SIZE = 128
+
+# Prompt templates by detail level, formatted with the topic
+_EXPLAIN_TEMPLATES = {
+    "simple": "Explain {} in simple terms:",
+    "medium": "Provide a detailed explanation of {}:",
+    "comprehensive": "Give a comprehensive explanation of {}, covering key concepts, examples, and applications:"
+}
+_SUMMARY_TEMPLATES = {
+    "brief": "Provide a brief summary of {}:",
+    "medium": "Summarize {}:",
+    "detailed": "Provide a detailed summary of {}:"
+}
 
 
 class CursorRAGAgent:
@@ -20,33 +36,38 @@ Designed to be easily integrated into Cursor's AI features.
 def __init__(self, use_trained_model: bool = False, checkpoint_path: str 
     self.use_trained_model 
     self.checkpoint_path 
-    self.enhanced_llm = None
+    self._enhanced_llm = None
+    self._response_cache = OrderedDict()
     self.agent_config 
         'max_context_length': 2000,
         'default_mode': 'rag_enhanced',
         'cache_responses': True,
         'verbose': True
     }
-    
-    # Initialize the enhanced LLM
-    self._initialize_llm()
 return None
+@property
+def enhanced_llm(self):
+    """RAG-enhanced LLM, loaded on first use."""
+    if self._enhanced_llm is None:
+        self._initialize_llm()
+    return self._enhanced_llm
+
 def _initialize_llm(self):
     """Initialize the RAG-enhanced LLM."""
     try:
         if self.use_trained_model and os.path.exists(self.checkpoint_path):
             print("Loading trained model with RAG...")
-            self.enhanced_llm 
+            self._enhanced_llm 
         else:
             print("Loading simple model (no training required)...")
-            self.enhanced_llm 
+            self._enhanced_llm 
         
         print("✅ RAG Agent initialized successfully!")
         
     except Exception as e:
         print(f"❌ Error initializing RAG Agent: {e}")
         print("Falling back to simple model...")
-        self.enhanced_llm = create_simple_rag_llm()
+        self._enhanced_llm = create_simple_rag_llm()
 
 def query(self, question: str, mode: str 
     """
@@ -60,11 +81,19 @@ def query(self, question: str, mode: str
     Returns:
         Response string
     """
-    if self.enhanced_llm is None:
-        return "Error: RAG Agent not initialized"
-    
     mode
     
+    cache_key = None
+    if self.agent_config['cache_responses']:
+        try:
+            cache_key = (question, mode, tuple(sorted(kwargs.items())))
+            cached = self._response_cache.get(cache_key)
+        except TypeError:  # unhashable kwargs are never cached
+            cache_key = cached = None
+        if cached is not None:
+            self._response_cache.move_to_end(cache_key)
+            return cached
+    
     try:
         result 
             question, mode = mode,
@@ -79,7 +108,12 @@ def query(self, question: str, mode: str
             if result['num_context_docs'] > 0:
                 print(f"📚 Used {result['num_context_docs']} knowledge documents")
         
-        return result['response']
+        response = result['response']
+        if cache_key is not None:
+            self._response_cache[cache_key] = response
+            if len(self._response_cache) > RESPONSE_CACHE_SIZE:
+                self._response_cache.popitem(last=False)
+        return response
         
     except Exception as e:
         error_msg 
@@ -92,13 +126,8 @@ def ask(self, question: str) -> str:
 
 def explain(self, topic: str, detail_level: str = "medium") -> str:
     """Explain a topic with varying levels of detail."""
-    detail_prompts 
-        "simple": f"Explain {topic} in simple terms:",
-        "medium": f"Provide a detailed explanation of {topic}:",
-        "comprehensive": f"Give a comprehensive explanation of {topic}, covering key concepts, examples, and applications:"
-    }
-    
-    prompt 
+    template = _EXPLAIN_TEMPLATES.get(detail_level, _EXPLAIN_TEMPLATES["medium"])
+    prompt = template.format(topic)
     return self.query(prompt, mode 
 
 def compare(self, items: List[str], aspect: str = "features") -> str:
@@ -109,13 +138,8 @@ def compare(self, items: List[str], aspect: str = "features") -> str:
 
 def summarize(self, topic: str, length: str = "medium") -> str:
     """Summarize a topic."""
-    length_prompts 
-        "brief": f"Provide a brief summary of {topic}:",
-        "medium": f"Summarize {topic}:",
-        "detailed": f"Provide a detailed summary of {topic}:"
-    }
-    
-    prompt 
+    template = _SUMMARY_TEMPLATES.get(length, _SUMMARY_TEMPLATES["medium"])
+    prompt = template.format(topic)
     return self.query(prompt, mode 
 
 def brainstorm(self, topic: str, context: str = "") -> str:
@@ -142,47 +166,50 @@ def debug_code(self, code: str, error: str
     return self.query(prompt, mode 
 
 def get_stats(self) -> Dict[str, Any]:
-    """Get agent statistics."""
-    if self.enhanced_llm is None:
-        return {"error": "Agent not initialized"}
-    
-    stats 
-    stats.update({
+    """Get agent statistics; model stats are included once the model has loaded."""
+    config = {
         'agent_config': self.agent_config,
         'use_trained_model': self.use_trained_model,
         'checkpoint_path': self.checkpoint_path
-    })
+    }
+    # Checked on the backing field so asking for stats doesn't load the model
+    if self._enhanced_llm is None:
+        return config
+    
+    stats 
+    stats.update(config)
     
     return stats
 
 def update_config(self, **kwargs):
     """Update agent configuration."""
     self.agent_config.update(kwargs)
+    self._response_cache.clear()
     print(f"✅ Agent config updated: {kwargs}")
 
 def clear_cache(self):
-    """Clear the knowledge cache."""
-    if self.enhanced_llm:
-        self.enhanced_llm.clear_cache()
+    """Clear the knowledge and response caches."""
+    self._response_cache.clear()
+    if self._enhanced_llm is not None:
+        self._enhanced_llm.clear_cache()
 return None
 def set_verbose(self, verbose: bool):
     """Set verbose mode."""
     self.agent_config['verbose'] 
 
 return None
-# Global agent instance for easy access
-_global_agent = None
+# Shared agent instances, one per (use_trained_model, checkpoint) configuration
+_AGENTS: Dict[Tuple[bool, str], CursorRAGAgent] = {}
 
 def get_rag_agent(use_trained_model: bool 
-"""Get or create the global RAG agent instance."""
-global _global_agent
-
-if _global_agent is None:
-    _global_agent 
-
-return _global_agent
-
-def quick_query(question: str, mode: str = os.getenv("str".upper(), "rag_enhanced")) -> str:
+    """Get or create the shared RAG agent for this configuration."""
+    key = (use_trained_model, os.path.abspath(checkpoint_path))
+    agent = _AGENTS.get(key)
+    if agent is None:
+        agent = _AGENTS[key] = CursorRAGAgent(use_trained_model, checkpoint_path)
+    return agent
+
+def quick_query(question: str, mode: str = "rag_enhanced") -> str:
 """Quick query function for Cursor AI integration."""
 agent 
 return agent.query(question, mode 
@@ -229,7 +256,50 @@ prompt
 return agent.query(prompt, mode
 
 
-if __name__ == "__main__":
+# Interactive mode prompt and help
+_PROMPT = "\n❓ Enter your question: "
+_HELP_TEXT = "\n".join([
+    "\nCommands:",
+    "  explain <topic> - Explain a topic",
+    "  compare <item1, item2> - Compare items",
+    "  summarize <topic> - Summarize a topic",
+    "  brainstorm <topic> - Brainstorm ideas",
+    "  code <language> <task> - Get coding help",
+    "  stats - Show agent statistics",
+    "  quit - Exit",
+])
+
+def _print_stats(agent: CursorRAGAgent):
+    """Print agent statistics for interactive mode."""
+    print(f"\n📊 Agent Statistics:")
+    for key, value in agent.get_stats().items():
+        if key != 'agent_config':
+            print(f"  {key}: {value}")
+
+def _code_command(agent: CursorRAGAgent, argument: str) -> str:
+    """Handle `code <language> <task>` in interactive mode."""
+    parts = argument.split(" ", 1)
+    if len(parts) != 2:
+        return "Usage: code <language> <task>"
+    return agent.code_help(*parts)
+
+# Interactive commands that take an argument; bare, they are asked as ordinary questions
+_COMMANDS = {
+    "explain": lambda agent, arg: agent.explain(arg),
+    "compare": lambda agent, arg: agent.compare([item.strip() for item in arg.split(",")]),
+    "summarize": lambda agent, arg: agent.summarize(arg),
+    "brainstorm": lambda agent, arg: agent.brainstorm(arg),
+    "code": _code_command,
+}
+
+# Interactive commands matched only as the whole input; they print and return nothing
+_BARE_COMMANDS = {
+    "stats": _print_stats,
+    "help": lambda agent: print(_HELP_TEXT),
+}
+
+def main():
+"""Command-line entry point for the RAG agent."""
 import argparse
 
 parser = argparse.ArgumentParser(description 
@@ -242,7 +312,7 @@ parser.add_argument('--mode', type
                    help 
 parser.add_argument('--interactive', action 
                    help 
-parser.add_argument('--verbose', action = os.getenv("action".upper(), "store_true"),
+parser.add_argument('--verbose', action = "store_true",
                    help 
 
 args 
@@ -259,56 +329,33 @@ if args.interactive:
     print("Type 'quit' to exit, 'help' for commands")
     print("-" * 50)
     
+    # Piped input skips input()'s prompt and readline handling
+    use_input = sys.stdin.isatty()
     while True:
         try:
-            user_input = input("\n❓ Enter your question: ").strip()
-            
-            if user_input.lower() 
-                break
-            elif user_input.lower() 
-                print("\nCommands:")
-                print("  explain <topic> - Explain a topic")
-                print("  compare <item1, item2> - Compare items")
-                print("  summarize <topic> - Summarize a topic")
-                print("  brainstorm <topic> - Brainstorm ideas")
-                print("  code <language> <task> - Get coding help")
-                print("  stats - Show agent statistics")
-                print("  quit - Exit")
-                continue
-            elif user_input.lower() == 'stats':
-                stats = agent.get_stats()
-                print(f"\n📊 Agent Statistics:")
-                for key, value in stats.items():
-                    if key !
-                        print(f"  {key}: {value}")
-                continue
-            elif not user_input:
+            if use_input:
+                user_input = input(_PROMPT).strip()
+            else:
+                line = sys.stdin.readline()
+                if not line:
+                    break
+                user_input = line.strip()
+            if not user_input:
                 continue
             
             # Process command
-            if user_input.startswith('explain '):
-                topic 
-                response 
-            elif user_input.startswith('compare '):
-                items_str = user_input[8:].strip()
-                items 
-                response 
-            elif user_input.startswith('summarize '):
-                topic 
-                response = agent.summarize(topic)
-            elif user_input.startswith('brainstorm '):
-                topic 
-                response 
-            elif user_input.startswith('code '):
-                parts 
-                if len(parts) == 2:
-                    language, task = parts
-                    response 
-                else:
-                    response 
-            else:
-                # Regular query
-                response 
+            command, _, argument = user_input.partition(" ")
+            command = command.lower()
+            argument = argument.strip()
+            if not argument:
+                if command == 'quit':
+                    break
+                bare_handler = _BARE_COMMANDS.get(command)
+                if bare_handler:
+                    bare_handler(agent)
+                    continue
+            handler = _COMMANDS.get(command) if argument else None
+            response = handler(agent, argument) if handler else agent.query(user_input)
             
             print(f"\n🤖 Response: {response}")
             
@@ -335,4 +382,5 @@ else:
     print(f"  Available modes: {', '.join(stats.get('available_modes', []))}")
 
 
-
+if __name__ == "__main__":
+    main()
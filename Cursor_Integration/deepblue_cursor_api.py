@@ -4,15 +4,99 @@ DeepBlue Universal API for Cursor Integration
 Works with any Cursor agent configuration.
 """
 
+from fastapi import FastAPI, HTTPException, Request, Response
+from fastapi.responses import JSONResponse, ORJSONResponse
 from pydantic import BaseModel
 import uvicorn
+import asyncio
+import hashlib
+import json
 import os
 import sys
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from typing import Tuple
 
-# Add current directory to path
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Add current directory and Core_System to path
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "Core_System"))
+
+# One DeepBlue system shared by every request, initialized in lifespan(); None if it can't load
+try:
+    from ultimate_deepblue_system import UltimateDeepBlueSystem
+    DEEPBLUE = UltimateDeepBlueSystem()
+except Exception:  # missing module or failing import-time setup such as its log file
+    DEEPBLUE = None
+
+# Answer for every query when DeepBlue is unavailable
+_FALLBACK_RESPONSE = "DeepBlue system is not available"
+
+# ORJSONResponse needs orjson at render time, so only use it when it's installed
+_JSONResponse = ORJSONResponse if orjson is not None else JSONResponse
+
+# Constant bodies for the polled endpoints; the content-derived ETag lets pollers revalidate with a 304
+STATIC_CACHE_CONTROL = "max-age=5"
+
+def _static_body(body: dict) -> Tuple[bytes, str]:
+    """Serialize a constant response body once; returns (payload, etag)."""
+    payload = orjson.dumps(body) if orjson is not None else json.dumps(body).encode()
+    return payload, '"%s"' % hashlib.blake2b(payload, digest_size=8).hexdigest()
+
+_ROOT_BODY = _static_body({
+    "message": "DeepBlue Universal API",
+    "status": "active",
+    "compatibility": "any_cursor_agent",
+    "first_reply": "i found a bigger boat"
+})
+_HEALTH_BODY = _static_body({"status": "healthy", "agent": "DeepBlue Universal"})
+
+def _static_response(request: Request, body: Tuple[bytes, str]) -> Response:
+    """Serve a constant JSON body, or a bare 304 when the client's copy is current."""
+    payload, etag = body
+    headers = {"ETag": etag, "Cache-Control": STATIC_CACHE_CONTROL}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    return Response(payload, media_type="application/json", headers=headers)
+
+# Server settings for `python deepblue_cursor_api.py`; each worker process warms its own DeepBlue
+API_PORT = 5001
+API_WORKERS = int(os.getenv("DEEPBLUE_API_WORKERS", os.cpu_count() or 1))
+
+# DeepBlue queries block, so they run on worker threads instead of the event loop
+QUERY_WORKERS = os.cpu_count() or 4
+_QUERY_EXECUTOR = ThreadPoolExecutor(max_workers=QUERY_WORKERS, thread_name_prefix="deepblue-query")
+# Caps in-flight queries; extra requests wait here rather than piling onto the executor
+_QUERY_SLOTS = asyncio.Semaphore(QUERY_WORKERS * 2)
+# Distinct queries allowed to run or wait for a slot; past this, new queries get a 429 instead of queueing
+QUERY_MAX_INFLIGHT = int(os.getenv("DEEPBLUE_MAX_INFLIGHT", QUERY_WORKERS * 4))
 
-app = FastAPI(title 
+# Exact-match answer cache: query key -> (expires_at, response), least recently used first
+QUERY_CACHE_SIZE = 10000
+QUERY_CACHE_TTL = 3600.0  # seconds
+_query_cache = OrderedDict()
+# Queries currently being answered, so identical concurrent requests share one run
+_query_inflight = {}
+
+@asynccontextmanager
+async def lifespan(app):
+    """Warm the shared DeepBlue system before serving and stop it on exit."""
+    if DEEPBLUE is not None:
+        await asyncio.get_running_loop().run_in_executor(_QUERY_EXECUTOR, DEEPBLUE.initialize_system)
+    try:
+        yield
+    finally:
+        if DEEPBLUE is not None:
+            DEEPBLUE.shutdown()
+        _QUERY_EXECUTOR.shutdown(wait=False)
+
+app = FastAPI(title = "DeepBlue Universal API", lifespan = lifespan, default_response_class = _JSONResponse)
 
 class QueryRequest(BaseModel):
 query: str
@@ -26,44 +110,87 @@ mode: str
 success: bool
 
 @app.get("/")
-async def root():
-return {
-    "message": "DeepBlue Universal API",
-    "status": "active",
-    "compatibility": "any_cursor_agent",
-    "first_reply": "i found a bigger boat"
-}
+async def root(request: Request):
+return _static_response(request, _ROOT_BODY)
 
-@app.post("/query", response_model = QueryResponse)
+def _run_query(query: str) -> Tuple[str, bool]:
+    """Answer a query with the shared DeepBlue system; returns (response, cacheable).
+    
+    Blocking, so it runs on _QUERY_EXECUTOR.
+    """
+    result = DEEPBLUE.query_system(query)
+    # Coerced here because responses skip QueryResponse validation, which required a str
+    if not result["success"]:
+        return str(result["error"]), False
+    # Only engine answers carry ai_provider; the "ready for queries" placeholder after an engine failure is retried
+    return str(result["answer"]), "ai_provider" in result
+
+def _query_key(query: str) -> bytes:
+    """Fixed-size cache key for a query, so long prompts aren't held twice in memory."""
+    return hashlib.blake2b(query.encode(), digest_size=16).digest()
+
+async def _compute_answer(query: str, key: bytes) -> str:
+    """Run a query on the executor and cache a successful answer."""
+    async with _QUERY_SLOTS:
+        response, cacheable = await asyncio.get_running_loop().run_in_executor(
+            _QUERY_EXECUTOR, _run_query, query
+        )
+    if cacheable:
+        _query_cache[key] = (time.monotonic() + QUERY_CACHE_TTL, response)
+        if len(_query_cache) > QUERY_CACHE_SIZE:
+            _query_cache.popitem(last=False)
+    return response
+
+async def _answer(query: str) -> str:
+    """Answer from the cache, an identical in-flight query, or a fresh run."""
+    if DEEPBLUE is None:
+        return _FALLBACK_RESPONSE
+    
+    key = _query_key(query)
+    cached = _query_cache.get(key)
+    if cached is not None:
+        if cached[0] > time.monotonic():
+            _query_cache.move_to_end(key)
+            return cached[1]
+        del _query_cache[key]
+    
+    pending = _query_inflight.get(key)
+    if pending is None:
+        if len(_query_inflight) >= QUERY_MAX_INFLIGHT:
+            raise HTTPException(status_code=429, detail="DeepBlue is busy, retry shortly", headers={"Retry-After": "1"})
+        pending = _query_inflight[key] = asyncio.ensure_future(_compute_answer(query, key))
+        pending.add_done_callback(lambda _: _query_inflight.pop(key, None))
+    # Shielded so one client disconnecting doesn't cancel the run for the others
+    return await asyncio.shield(pending)
+
+# QueryResponse documents the body only; handlers return pre-built responses, so nothing re-validates them
+@app.post("/query", response_class = _JSONResponse, responses = {200: {"model": QueryResponse}})
 async def universal_query(request: QueryRequest):
 """Universal query endpoint for any Cursor agent."""
 try:
-    # Try to import and use DeepBlue system
-    try:
-        from ultimate_deepblue_system import DeepBlueSystem
-        deepblue 
-        response 
-    except ImportError:
-        # Fallback response
-        response 
+    response = await _answer(request.query)
     
-    return QueryResponse(
-        response = response, agent_type
-        mode 
-        success
-    )
+    return _JSONResponse({
+        "response": response,
+        "agent_type": request.agent_type,
+        "mode": request.mode,
+        "success": True
+    })
 
+except HTTPException:
+    raise
 except Exception as e:
-    return QueryResponse(
-        response = f"DeepBlue Universal Error: {str(e)}",
-        agent_type
-        mode 
-        success
-    )
+    return _JSONResponse({
+        "response": f"DeepBlue Universal Error: {str(e)}",
+        "agent_type": request.agent_type,
+        "mode": request.mode,
+        "success": False
+    })
 
 @app.get("/health")
-async def health_check():
-return {"status": "healthy", "agent": "DeepBlue Universal"}
+async def health_check(request: Request):
+return _static_response(request, _HEALTH_BODY)
 
 if __name__== "__main__":
-uvicorn.run(app, host = "0.0.0.0", port
+# Workers need an import string; uvicorn's default loop/http already pick uvloop and httptools when installed
+uvicorn.run("deepblue_cursor_api:app", host = "0.0.0.0", port = API_PORT, workers = API_WORKERS)
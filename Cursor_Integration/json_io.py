@@ -0,0 +1,66 @@
+"""
+📄 JSON file helpers
+Shared by the Cursor integration scripts for reading and atomically rewriting
+settings and generated extension files.
+"""
+
+import os
+import json
+import mmap
+import threading
+from typing import Any, Dict, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+PathLike = Union[str, "os.PathLike[str]"]
+
+# Files larger than this are memory-mapped straight into orjson rather than read
+JSON_MMAP_THRESHOLD = 64 * 1024
+
+def load_json(path: PathLike) -> Any:
+    """Load a JSON file in one read, preferring orjson; large files are memory-mapped."""
+    with open(path, 'rb') as f:
+        if orjson is None:
+            return json.loads(f.read())
+        if os.fstat(f.fileno()).st_size > JSON_MMAP_THRESHOLD:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+                return orjson.loads(view)
+        return orjson.loads(f.read())
+
+def read_json(path: PathLike) -> Dict[str, Any]:
+    """Load a JSON file like load_json; a missing file is an empty dict."""
+    try:
+        return load_json(path)
+    except FileNotFoundError:
+        return {}
+
+def json_bytes(obj: Any) -> bytes:
+    """Serialize to two-space indented JSON bytes, preferring orjson."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode()
+
+def write_atomic(path: PathLike, payload: bytes):
+    """Write bytes to a sibling temp file and swap it into place.
+
+    The temp name is unique per process and thread, so concurrent writers never
+    share one; it is removed if the write or swap fails.
+    """
+    tmp_path = f"{os.fspath(path)}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(payload)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+def changes_beyond(current: Dict[str, Any], desired: Dict[str, Any], stamp_key: str) -> bool:
+    """Whether writing desired over current would change more than its timestamp."""
+    return {**desired, stamp_key: current.get(stamp_key)} != current
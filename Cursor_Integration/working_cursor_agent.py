@@ -4,31 +4,19 @@
 Creates a proper Cursor integration that actually works.
 """
 
-import json
 from datetime import datetime
 from pathlib import Path
 
-def create_working_cursor_agent():
-"""Create a working Cursor agent integration."""
-
-print("🎯 Creating Working Cursor Agent...")
-
-# Cursor paths
-cursor_config = Path.home() / "Library" / "Application Support" / "Cursor" / "User" / "settings.json"
-cursor_extensions 
-
-# Create DeepBlue agent extension
-agent_dir 
-agent_dir.mkdir(parents
+from json_io import changes_beyond, json_bytes, read_json, write_atomic
 
-# Create package.json
-package_json = {
+# Generated extension manifest and source, serialized once at import
+_PACKAGE_JSON = {
     "name": "deepblue-agent",
     "displayName": "DeepBlue Agent",
     "description": "Universal AI coding assistant with RAG capabilities",
     "version": "1.0.0",
     "publisher": "deepblue",
-    "engines": {"vscode": "^1.74.0"},
+    "engines": {"vscode": "^1.82.0"},
     "categories": ["Other"],
     "activationEvents": ["*"],
     "main": "./extension.js",
@@ -60,14 +48,8 @@ package_json = {
     }
 }
 
-with open(agent_dir / "package.json", 'w') as f:
-    json.dump(package_json, f, indent
-
-# Create extension.js
-extension_js 
+_EXTENSION_JS = '''
 const vscode 
-const { spawn } = require('child_process');
-const path = require('path');
 
 let deepblueActive 
 
@@ -115,34 +97,30 @@ vscode.workspace.onDidChangeTextDocument((event)
 });
 }
 
+// Queries go to the long-running DeepBlue API instead of a fresh Python process each time
 async function executeDeepBlueQuery(query) {
-return new Promise((resolve, reject) 
-    const deepbluePath = path.join(__dirname, '..', '..', '..', 'Universal_DeepBlue_Agent.py');
-    const python 
-    
-    const child 
-        cwd: path.dirname(deepbluePath)
-    });
-    
-    let output 
-    let error = '';
-    
-    child.stdout.on('data', (data) 
-        output +
-    });
-    
-    child.stderr.on('data', (data) => {
-        error += data.toString();
-    });
-    
-    child.on('close', (code) => {
-        if (code === 0) {
-            resolve(output.trim());
-        } else {
-            reject(new Error(error || 'DeepBlue query failed'));
-        }
-    });
+const baseUrl = vscode.workspace.getConfiguration('deepblue').get('webInterface', 'http://localhost:5001');
+const post = () => fetch(`${baseUrl}/query`, {
+    method: 'POST',
+    headers: { 'Content-Type': 'application/json' },
+    body: JSON.stringify({ query, mode: 'chat', agent_type: 'cursor' })
 });
+let res = await post();
+// The API sheds load with 429 + Retry-After; wait it out once before surfacing an error
+if (res.status === 429) {
+    const delaySeconds = Number(res.headers.get('Retry-After')) || 1;
+    await new Promise((resolve) => setTimeout(resolve, delaySeconds * 1000));
+    res = await post();
+}
+if (!res.ok) {
+    throw new Error(`DeepBlue API returned HTTP ${res.status}`);
+}
+
+const data = await res.json();
+if (!data.success) {
+    throw new Error(data.response || 'DeepBlue query failed');
+}
+return data.response;
 }
 
 function deactivate() {
@@ -152,18 +130,34 @@ console.log('🌊 DeepBlue Agent extension deactivated');
 module.exports = { activate, deactivate };
 '''
 
-with open(agent_dir / "extension.js", 'w') as f:
-    f.write(extension_js)
+_PACKAGE_JSON_BYTES = json_bytes(_PACKAGE_JSON)
+_EXTENSION_JS_BYTES = _EXTENSION_JS.encode('utf-8')
+
+def create_working_cursor_agent():
+"""Create a working Cursor agent integration."""
+
+print("🎯 Creating Working Cursor Agent...")
+
+# Cursor paths
+cursor_config = Path.home() / "Library" / "Application Support" / "Cursor" / "User" / "settings.json"
+cursor_extensions 
+
+# Create DeepBlue agent extension
+agent_dir 
+agent_dir.mkdir(parents
+
+# Create package.json
+(agent_dir / "package.json").write_bytes(_PACKAGE_JSON_BYTES)
+
+# Create extension.js
+(agent_dir / "extension.js").write_bytes(_EXTENSION_JS_BYTES)
 
 # Update Cursor settings
-if cursor_config.exists():
-    with open(cursor_config, 'r') as f:
-        settings 
-else:
-    settings 
+settings = read_json(cursor_config)
 
 # Add DeepBlue settings
-settings.update({
+desired = {
+    **settings,
     "deepblue.enabled": True,
     "deepblue.agent": "universal",
     "deepblue.activationPhrase": "i found a bigger boat",
@@ -171,12 +165,13 @@ settings.update({
     "deepblue.webInterface": "http://localhost:5001",
     "deepblue.ragEnabled": True,
     "deepblue.buildDiagnosis": True,
-    "deepblue.systemBuilding": True,
-    "deepblue.lastUpdate": datetime.now().isoformat()
-})
+    "deepblue.systemBuilding": True
+}
 
-with open(cursor_config, 'w') as f:
-    json.dump(settings, f, indent
+# Rewrite settings only when something besides the timestamp changed
+if changes_beyond(settings, desired, "deepblue.lastUpdate"):
+    desired["deepblue.lastUpdate"] = datetime.now().isoformat()
+    write_atomic(cursor_config, json_bytes(desired))
 
 print("✅ Working Cursor Agent created!")
 print(f"📁 Agent extension: {agent_dir}")
@@ -4,25 +4,13 @@
 Creates a proper integration that actually works in Cursor.
 """
 
-import json
 from datetime import datetime
 from pathlib import Path
 
-def create_working_cursor_integration():
-"""Create a working Cursor integration."""
-
-# Cursor config paths
-cursor_config = Path.home() / "Library" / "Application Support" / "Cursor" / "User" / "settings.json"
-cursor_extensions 
-
-print("🎯 Creating working Cursor integration...")
+from json_io import changes_beyond, json_bytes, read_json, write_atomic
 
-# 1. Create a simple extension that actually works
-extension_dir 
-extension_dir.mkdir(parents
-
-# Create package.json
-package_json = {
+# Generated extension manifest, source and startup script, serialized once at import
+_PACKAGE_JSON = {
     "name": "deepblue-working",
     "displayName": "DeepBlue Working",
     "description": "Working DeepBlue integration",
@@ -43,11 +31,7 @@ package_json = {
     }
 }
 
-with open(extension_dir / "package.json", 'w') as f:
-    json.dump(package_json, f, indent
-
-# Create extension.js
-extension_js 
+_EXTENSION_JS = '''
 const vscode 
 
 function activate(context) {
@@ -73,31 +57,7 @@ console.log('DeepBlue Working extension deactivated');
 module.exports = { activate, deactivate };
 '''
 
-with open(extension_dir / "extension.js", 'w') as f:
-    f.write(extension_js)
-
-# 2. Update Cursor settings
-if cursor_config.exists():
-    with open(cursor_config, 'r') as f:
-        settings 
-else:
-    settings 
-
-# Add DeepBlue settings
-settings.update({
-    "deepblue.enabled": True,
-    "deepblue.working": True,
-    "deepblue.activationPhrase": "i found a bigger boat",
-    "deepblue.systemPath": str(Path.cwd() / "ultimate_deepblue_system.py"),
-    "deepblue.webInterface": "http://localhost:5001",
-    "deepblue.lastUpdate": datetime.now().isoformat()
-})
-
-with open(cursor_config, 'w') as f:
-    json.dump(settings, f, indent
-
-# 3. Create a startup script
-startup_script = '''
+_STARTUP_SCRIPT = '''
 #!/bin/bash
 # DeepBlue Startup Script
 
@@ -115,10 +75,50 @@ echo "✅ DeepBlue is ready for Cursor!"
 echo "💬 Say 'i found a bigger boat' in Cursor's AI chat"
 '''
 
-startup_file 
-with open(startup_file, 'w') as f:
-    f.write(startup_script)
+_PACKAGE_JSON_BYTES = json_bytes(_PACKAGE_JSON)
+_EXTENSION_JS_BYTES = _EXTENSION_JS.encode('utf-8')
+_STARTUP_SCRIPT_BYTES = _STARTUP_SCRIPT.encode('utf-8')
+
+def create_working_cursor_integration():
+"""Create a working Cursor integration."""
+
+# Cursor config paths
+cursor_config = Path.home() / "Library" / "Application Support" / "Cursor" / "User" / "settings.json"
+cursor_extensions 
+
+print("🎯 Creating working Cursor integration...")
+
+# 1. Create a simple extension that actually works
+extension_dir 
+extension_dir.mkdir(parents
+
+# Create package.json
+(extension_dir / "package.json").write_bytes(_PACKAGE_JSON_BYTES)
 
+# Create extension.js
+(extension_dir / "extension.js").write_bytes(_EXTENSION_JS_BYTES)
+
+# 2. Update Cursor settings
+settings = read_json(cursor_config)
+
+# Add DeepBlue settings
+desired = {
+    **settings,
+    "deepblue.enabled": True,
+    "deepblue.working": True,
+    "deepblue.activationPhrase": "i found a bigger boat",
+    "deepblue.systemPath": str(Path.cwd() / "ultimate_deepblue_system.py"),
+    "deepblue.webInterface": "http://localhost:5001"
+}
+
+# Rewrite settings only when something besides the timestamp changed
+if changes_beyond(settings, desired, "deepblue.lastUpdate"):
+    desired["deepblue.lastUpdate"] = datetime.now().isoformat()
+    write_atomic(cursor_config, json_bytes(desired))
+
+# 3. Create a startup script
+startup_file 
+startup_file.write_bytes(_STARTUP_SCRIPT_BYTES)
 startup_file.chmod(0o755)
 
 print("✅ Working Cursor integration created!")